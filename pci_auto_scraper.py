@@ -9,12 +9,13 @@ import os  # Manipulation des chemins et système de fichiers
 import sys  # Configuration des chemins Python et gestion des erreurs système
 import time  # Mesure du temps d'exécution et timestamps
 import logging  # Système de logging structuré
-import base64  # Encodage des pièces jointes email
+from concurrent.futures import ThreadPoolExecutor  # Parallélisation des phases de setup I/O-bound
 from datetime import datetime  # Génération de timestamps et horodatage
 from typing import Dict, List, Optional  # Annotations de types pour la documentation du code
 import shutil  # Opérations de copie et archivage des fichiers
 import pandas as pd  # Manipulation des données CSV et DataFrames
-import resend  # Service d'envoi d'emails pour les notifications
+# Note: resend et base64 sont importés paresseusement dans send_email_summary
+# pour ne pas payer leur coût d'import sur les exécutions sans envoi d'email
 
 # Configuration des chemins des modules : architecture modulaire avec 3 composants principaux
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -52,9 +53,9 @@ from dotenv import load_dotenv
 # Chargement des variables d'environnement (.env)
 load_dotenv()
 
-# Initialisation de l'API Resend avec validation obligatoire
-resend.api_key = os.getenv('RESEND_API_KEY')
-if not resend.api_key:
+# Validation obligatoire de la clé API Resend (l'import du module est différé)
+RESEND_API_KEY = os.getenv('RESEND_API_KEY')
+if not RESEND_API_KEY:
     logger.error("RESEND_API_KEY non trouvée dans les variables d'environnement. Créez un fichier .env avec votre clé API.")
     sys.exit(1)
 
@@ -709,6 +710,12 @@ class PCIAutoScraper:
         try:
             logger.info("📧 Envoi du récapitulatif par email...")
 
+            # Imports paresseux : ces modules ne servent qu'au chemin d'envoi d'email
+            # (le cache de modules CPython rend le coût unique au premier appel)
+            import base64
+            import resend
+            resend.api_key = RESEND_API_KEY
+
             # Calcul du statut de la session basé sur les métriques
             if self.stats['changes_detected'] == 0:
                 status = "Aucun Changement"
@@ -933,12 +940,14 @@ class PCIAutoScraper:
             logger.info("Démarrage du PCI Auto Scraper")
             logger.info(f"Session: {self.timestamp}")
             
-            # Crée le répertoire de téléchargement
-            os.makedirs(self.download_dir, exist_ok=True)
-            
-            # Configure les scrapers
-            if not self.setup_scrapers():
-                return False
+            # Création du répertoire de téléchargement et configuration des scrapers
+            # en parallèle : les deux phases sont indépendantes (I/O disque vs réseau)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future_dir = executor.submit(os.makedirs, self.download_dir, exist_ok=True)
+                future_setup = executor.submit(self.setup_scrapers)
+                future_dir.result()
+                if not future_setup.result():
+                    return False
             
             # Étape 1: Détection des changements
             logger.info("\n" + "="*50)
@@ -6,34 +6,102 @@ Scraper intelligent pour extraire et comparer les documents du site PCI Security
 Architecture : Web Scraping -> Language Detection -> Version Comparison -> Change Detection
 """
 
+import sys  # Écriture bufferisée des statistiques sur stdout
 import time  # Gestion des délais et temporisation pour le scraping
+import re  # Expressions régulières précompilées pour les mappings de langue
 import csv  # Export des données en format CSV (legacy)
+import functools  # Mise en cache du chemin ChromeDriver entre instanciations
+import itertools  # Chaînage des résultats des workers de scraping
+import multiprocessing  # Scraping parallèle des catégories (un Chrome par worker)
+import tempfile  # Profils Chrome isolés pour les workers parallèles
 import logging  # Système de logging pour traçabilité des opérations
 import os  # Manipulation des fichiers et chemins système
-import glob  # Recherche de fichiers par patterns (pour comparaisons)
 import shutil  # Opérations de copie et backup des fichiers
+from concurrent.futures import ThreadPoolExecutor  # Recouvrement persistance / fermeture du driver
 from datetime import datetime  # Timestamps pour versioning et horodatage
-from typing import List, Dict, Tuple, Optional, Set  # Annotations de types pour la robustesse du code
-from selenium import webdriver  # Driver principal pour automatisation web
-from selenium.webdriver.common.by import By  # Sélecteurs d'éléments DOM
-from selenium.webdriver.support.ui import WebDriverWait, Select  # Attente et manipulation des dropdowns
-from selenium.webdriver.support import expected_conditions as EC  # Conditions d'attente Selenium
-from selenium.webdriver.chrome.service import Service  # Service Chrome pour Selenium
-from selenium.webdriver.chrome.options import Options  # Configuration Chrome (headless, etc.)
+from pathlib import Path  # Chemins portables pour le répertoire de données
+from typing import List, Dict, Tuple, Optional, Set, TYPE_CHECKING  # Annotations de types pour la robustesse du code
+from selenium.webdriver.common.by import By  # Sélecteurs d'éléments DOM (léger, requis par les locators de classe)
 from selenium.common.exceptions import TimeoutException, NoSuchElementException  # Gestion des erreurs Selenium
-from webdriver_manager.chrome import ChromeDriverManager  # Gestion automatique du driver Chrome
-import pandas as pd  # Manipulation avancée des données et comparaisons
+
+# pandas, webdriver_manager et les modules Selenium lourds (webdriver,
+# expected_conditions, Select…) sont importés paresseusement dans leurs
+# consommateurs : leur coût d'import n'est payé qu'à la première utilisation
+# et plus au chargement du module (utile au mode comparaison sans scraping)
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Répertoire des données de référence : configurable via PCI_DATA_DIR,
+# par défaut le répertoire du module (remplace l'ancien chemin absolu codé en dur)
+DATA_DIR = Path(os.getenv('PCI_DATA_DIR', Path(__file__).resolve().parent))
+
+# Regex précompilées pour la classification des catégories : une seule passe
+# sur la chaîne au lieu d'un scan par mot-clé
+_CAT_RE = re.compile(r'pci|dss|saq|aoc|attestation')
+_AOC_RE = re.compile(r'aoc|attestation')
+
+@functools.lru_cache(maxsize=4096)
+def _precise_category(document_name_lower: str, base_category: str) -> str:
+    """Classification fine mémoïsée : les mêmes noms reviennent à chaque run"""
+    if base_category == "SAQ":
+        # Détecte les documents AOC (Attestation of Compliance)
+        if _AOC_RE.search(document_name_lower):
+            return "SAQ AOC"
+        return "SAQ"
+    return base_category
+
+def _documents_digest(rows) -> str:
+    """Empreinte stable d'un jeu de documents (ordre indifférent)
+
+    blake2b sur les tuples triés (name, category, version, langues) : plus
+    rapide que sha256 sur chaînes courtes et suffisant pour détecter un
+    snapshot strictement identique.
+    """
+    import hashlib
+    h = hashlib.blake2b(digest_size=16)
+    for row in sorted(rows, key=lambda r: (r[1], r[0])):
+        h.update(('\0'.join(row) + '\n').encode('utf-8'))
+    return h.hexdigest()
+
+@functools.lru_cache(maxsize=1)
+def _driver_path() -> str:
+    """Résout le binaire ChromeDriver une seule fois par processus
+
+    ChromeDriverManager().install() touche le disque (et potentiellement le
+    réseau) pour vérifier la version ; ce coût est amorti entre les instances.
+    """
+    from webdriver_manager.chrome import ChromeDriverManager  # Import paresseux
+    return ChromeDriverManager().install()
+
 class PCIDocumentScraper:
     """
     Scraper intelligent pour la détection de changements PCI DSS/SAQ
     Combine scraping Selenium, détection de langues et comparaison de versions
     """
 
+    # Mapping précompilé des libellés de langue vers les codes ISO :
+    # un seul scan regex C-level remplace la chaîne de tests `in` Python
+    _LANG_MAP = {
+        'English': 'EN',
+        'French': 'FR',
+        'Chinese': 'ZH',
+        'German': 'DE',
+        'Japanese': 'JA',
+        'Portuguese': 'PT',
+        'Spanish': 'ES',
+    }
+    _LANG_RE = re.compile(r'\b(' + '|'.join(_LANG_MAP) + r')\s+PDF\b')
+
+    # Locators partagés : un seul tuple (By, sélecteur) alloué par sélecteur,
+    # réutilisé par tous les appels au lieu d'une chaîne littérale par site
+    _SEL_DOC_NAME = (By.CSS_SELECTOR, "span.document_name")
+    _SEL_CATEGORY = (By.CSS_SELECTOR, "#document_category")
+    _SEL_LANG_SELECT = (By.CSS_SELECTOR, "select[data-doc_idx]")
+
     def __init__(self, headless: bool = False):
         """
         Initialise le scraper avec configuration personnalisable
@@ -46,12 +114,31 @@ class PCIDocumentScraper:
         self.wait = None   # WebDriverWait pour les attentes conditionnelles
         self.headless = headless  # Mode d'exécution du navigateur
         self.documents = []  # Cache des documents extraits
+        self._cached_categories = None  # Catégories du dropdown (résolues une fois par session)
+        self._current_filter = None  # Dernier filtre appliqué avec succès
+        self._current_count = None  # Total du dernier dataset comparé (pour le rapport)
         
-    def setup_driver(self):
-        """Configuration avancée du driver Chrome avec options anti-détection"""
+    def setup_driver(self, user_data_dir: Optional[str] = None):
+        """
+        Configuration avancée du driver Chrome avec options anti-détection
+
+        Args:
+            user_data_dir: Profil Chrome dédié (requis pour les workers parallèles
+                           afin d'éviter les collisions de verrou de profil)
+        """
         try:
+            # Imports Selenium paresseux (voir en-tête du module)
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.support.ui import WebDriverWait
+
             chrome_options = Options()
 
+            # Stratégie eager : driver.get rend la main à DOMContentLoaded
+            # sans attendre les sous-ressources (le scraper ne lit que le DOM)
+            chrome_options.page_load_strategy = 'eager'
+
             # Configuration de base selon le mode
             if self.headless:
                 chrome_options.add_argument("--headless")
@@ -62,35 +149,87 @@ class PCIDocumentScraper:
             chrome_options.add_argument("--disable-gpu")  # Désactive le GPU pour la stabilité
             chrome_options.add_argument("--window-size=1920,1080")  # Résolution standard pour cohérence
 
+            # Profil isolé pour éviter les verrous de profil en scraping
+            # parallèle ; à défaut, profil persistant optionnel (variable
+            # PCI_CHROME_PROFILE) pour réutiliser cookies, DNS et cache HTTP
+            # entre deux runs nocturnes
+            if user_data_dir is None:
+                user_data_dir = os.getenv('PCI_CHROME_PROFILE')
+            if user_data_dir:
+                chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+            # Cache disque de 100 Mo : les chargements suivants servent les
+            # sous-ressources inchangées depuis le cache navigateur
+            chrome_options.add_argument("--disk-cache-size=104857600")
+
+            # Blocage des ressources inutiles au scraping (images, polices, CSS) :
+            # seuls les nœuds texte du DOM sont lus, couper ces octets réduit
+            # directement le temps de chargement de chaque page
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+                "profile.managed_default_content_settings.plugins": 2,
+            })
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+
             # User-Agent réaliste pour éviter la détection de bot
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
 
-            # Gestion automatique du driver avec webdriver-manager
-            service = Service(ChromeDriverManager().install())
+            # Gestion automatique du driver avec webdriver-manager (chemin mis en cache)
+            service = Service(_driver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
 
+            # Blocage CDP des requêtes tierces (analytics, polices, trackers) :
+            # des octets que le scraper paie à chaque navigation sans jamais
+            # les lire. Best-effort : un échec CDP ne doit pas bloquer le run
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                    '*google-analytics.com*', '*googletagmanager.com*',
+                    '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+                    '*.woff*', '*.ttf',
+                    '*hotjar*', '*doubleclick*', '*facebook*',
+                ]})
+            except Exception as e:
+                logger.debug("Blocage CDP des URLs indisponible: %s", e)
+
             # Configuration des timeouts avec attente généreuse pour le contenu dynamique
-            self.wait = WebDriverWait(self.driver, 20)
+            # Sondage à 250 ms (au lieu des 500 ms par défaut) : les attentes
+            # conditionnelles rendent la main plus vite après un re-rendu AJAX
+            self.wait = WebDriverWait(self.driver, 20, poll_frequency=0.25)
 
             logger.info("Driver Selenium configuré avec succès")
 
         except Exception as e:
-            logger.error(f"Erreur lors de la configuration du driver: {e}")
+            logger.error("Erreur lors de la configuration du driver: %s", e)
             raise
     
     def wait_for_page_load(self):
         """Stratégie d'attente intelligente pour le contenu dynamique JavaScript"""
         try:
+            from selenium.webdriver.support import expected_conditions as EC  # Import paresseux
+
             # Attente de l'élément clé indiquant que les documents sont chargés
             self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "document_name")))
 
-            # Délai supplémentaire pour stabiliser le contenu AJAX/JavaScript
-            time.sleep(3)  # Buffer pour les requêtes asynchrones tardives
+            # Attente adaptative : on repart dès que le DOM est stabilisé
+            # plutôt qu'après un délai fixe arbitraire
+            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
 
             logger.info("Page chargée avec succès")
         except TimeoutException:
             logger.warning("Timeout lors du chargement de la page")
     
+    def _selected_option_text(self, select_element) -> str:
+        """Lit le libellé de l'option sélectionnée en un seul appel JS"""
+        return self.driver.execute_script(
+            "return arguments[0].selectedOptions[0].textContent;", select_element
+        ).strip()
+
     def select_filter(self, filter_value: str) -> bool:
         """
         Système de filtrage intelligent avec validation d'état
@@ -102,35 +241,57 @@ class PCIDocumentScraper:
             bool: True si filtrage réussi et validé, False en cas d'échec
         """
         try:
-            logger.info(f"Sélection du filtre: {filter_value}")
+            from selenium.webdriver.support.ui import Select  # Import paresseux
+            from selenium.webdriver.support import expected_conditions as EC  # Import paresseux
+
+            # Court-circuit sans aucun aller-retour DOM : le dernier filtre
+            # appliqué avec succès est suivi côté Python
+            if filter_value == self._current_filter:
+                logger.info("Le filtre %s est déjà actif (cache)", filter_value)
+                return True
+
+            logger.info("Sélection du filtre: %s", filter_value)
 
             # Localisation du dropdown natif HTML (plus fiable que JS)
-            native_select_element = self.driver.find_element(By.CSS_SELECTOR, "#document_category")
+            native_select_element = self.driver.find_element(*self._SEL_CATEGORY)
             select = Select(native_select_element)
 
-            # Optimisation : vérification de l'état actuel avant modification
-            current_option = select.first_selected_option.text.strip()
+            # Optimisation : vérification de l'état actuel avant modification.
+            # Lecture en un seul aller-retour JS : first_selected_option.text
+            # coûte deux commandes WebDriver (recherche + lecture du texte)
+            current_option = self._selected_option_text(native_select_element)
             if current_option == filter_value:
-                logger.info(f"Le filtre {filter_value} est déjà sélectionné")
+                logger.info("Le filtre %s est déjà sélectionné", filter_value)
+                self._current_filter = filter_value
                 return True
 
+            # Capture d'un élément de la liste actuelle pour détecter le re-rendu AJAX
+            old_rows = self.driver.find_elements(*self._SEL_DOC_NAME)
+
             # Application du nouveau filtre
             select.select_by_visible_text(filter_value)
 
-            # Attente pour le rendu AJAX du contenu filtré
-            time.sleep(5)
+            # Attente adaptative : l'ancienne liste devient obsolète puis la
+            # nouvelle apparaît — on repart dès que le contenu filtré est rendu
+            if old_rows:
+                try:
+                    self.wait.until(EC.staleness_of(old_rows[0]))
+                except TimeoutException:
+                    pass  # Le DOM a pu être réutilisé sans re-création des éléments
+            self.wait.until(EC.presence_of_element_located(self._SEL_DOC_NAME))
 
             # Validation post-sélection de l'état du filtre
-            new_option = select.first_selected_option.text.strip()
+            new_option = self._selected_option_text(native_select_element)
             if new_option == filter_value:
-                logger.info(f"Filtre {filter_value} appliqué avec succès")
+                logger.info("Filtre %s appliqué avec succès", filter_value)
+                self._current_filter = filter_value
                 return True
             else:
-                logger.warning(f"Le filtre {filter_value} n'a pas été appliqué correctement")
+                logger.warning("Le filtre %s n'a pas été appliqué correctement", filter_value)
                 return False
                 
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Erreur lors de la sélection du filtre {filter_value}: {e}")
+            logger.error("Erreur lors de la sélection du filtre %s: %s", filter_value, e)
             return False
     
     def extract_documents(self, category: str) -> List[Dict[str, str]]:
@@ -146,146 +307,140 @@ class PCIDocumentScraper:
         documents = []
         
         try:
-            logger.info(f"Extraction des documents pour la catégorie: {category}")
+            from selenium.webdriver.support import expected_conditions as EC  # Import paresseux
 
-            # Stabilisation après filtrage pour laisser le DOM se reconstruire
-            time.sleep(3)
+            logger.info("Extraction des documents pour la catégorie: %s", category)
 
-            # Localisation des éléments DOM par sélecteurs CSS spécialisés
-            document_elements = self.driver.find_elements(By.CSS_SELECTOR, "span.document_name")
-            version_elements = self.driver.find_elements(By.CSS_SELECTOR, "div[id*='version_select_']")
+            # Le filtrage garantit déjà des éléments frais (attente de staleness
+            # dans select_filter), on attend simplement leur présence
+            self.wait.until(EC.presence_of_element_located(self._SEL_DOC_NAME))
 
-            logger.info(f"Trouvé {len(document_elements)} documents et {len(version_elements)} versions")
+            # Extraction batch en un seul aller-retour WebDriver : le DOM est
+            # parcouru côté navigateur et renvoyé en un tableau JSON, au lieu
+            # d'une commande Selenium par lecture de .text (O(N) round-trips)
+            raw_documents = self.driver.execute_script("""
+                const names = document.querySelectorAll('span.document_name');
+                const versions = document.querySelectorAll("div[id^='version_select_']");
+                const langSelects = document.querySelectorAll('select[data-doc_idx]');
+                const out = [];
+                for (let i = 0; i < names.length; i++) {
+                    const opts = langSelects[i]
+                        ? Array.from(langSelects[i].options).map(o => o.text)
+                        : [];
+                    out.push({
+                        name: names[i].innerText.trim(),
+                        version: versions[i] ? versions[i].innerText.trim() : '',
+                        options: opts
+                    });
+                }
+                return out;
+            """)
 
-            # Synchronisation des arrays pour éviter les index out of bounds
-            min_count = min(len(document_elements), len(version_elements))
-            
-            # Boucle d'extraction principale avec enrichissement des métadonnées
-            for i in range(min_count):
-                try:
-                    # Extraction des données de base
-                    document_name = document_elements[i].text.strip()
-                    version = version_elements[i].text.strip()
+            logger.info("Trouvé %s documents via extraction batch", len(raw_documents))
 
-                    if not document_name:
-                        continue
+            # Mapping des métadonnées en Python pur sur le tableau retourné.
+            # Plus de try/except par document : le tableau JS ne contient que
+            # des dicts simples, les cas limites sont gérés par des tests
+            # explicites (nom vide, version absente)
+            for raw_doc in raw_documents:
+                document_name = raw_doc.get('name', '').strip()
+                if not document_name:
+                    continue
 
-                    # Pipeline d'enrichissement automatique
-                    available_languages = self.detect_available_languages(i)  # Détection multilingue
-                    precise_category = self.determine_precise_category(document_name, category)  # Catégorisation fine
+                version = raw_doc.get('version', '').strip()
 
-                    # Construction de l'objet document avec métadonnées complètes
-                    document_info = {
-                        'name': document_name,
-                        'version': version if version else "N/A",
-                        'category': precise_category,
-                        'available_languages': available_languages
-                    }
+                # Pipeline d'enrichissement automatique
+                available_languages = self.map_language_options(raw_doc.get('options', []))  # Détection multilingue
+                precise_category = self.determine_precise_category(document_name, category)  # Catégorisation fine
 
-                    documents.append(document_info)
-                    logger.debug(f"Document extrait: {document_name} - Version: {version} - Catégorie: {precise_category} - Langues: {available_languages}")
+                # Construction de l'objet document avec métadonnées complètes
+                documents.append({
+                    'name': document_name,
+                    'version': version if version else "N/A",
+                    'category': precise_category,
+                    'available_languages': available_languages
+                })
+                logger.debug("Document extrait: %s - Version: %s - Catégorie: %s - Langues: %s", document_name, version, precise_category, available_languages)
 
-                except Exception as e:
-                    logger.warning(f"Erreur lors de l'extraction du document {i}: {e}")
-                    continue
-            
-            # Gestion des documents orphelins (sans version associée)
-            if len(document_elements) > len(version_elements):
-                for i in range(len(version_elements), len(document_elements)):
-                    try:
-                        document_name = document_elements[i].text.strip()
-                        if document_name:
-                            # Traitement des documents sans métadonnées de version
-                            available_languages = self.detect_available_languages(i)
-                            precise_category = self.determine_precise_category(document_name, category)
-
-                            document_info = {
-                                'name': document_name,
-                                'version': "N/A",  # Version inconnue/non disponible
-                                'category': precise_category,
-                                'available_languages': available_languages
-                            }
-                            documents.append(document_info)
-                            logger.debug(f"Document extrait (sans version): {document_name} - Catégorie: {precise_category} - Langues: {available_languages}")
-                    except Exception as e:
-                        logger.warning(f"Erreur lors de l'extraction du document {i}: {e}")
-                        continue
-            
-            logger.info(f"Extraction terminée: {len(documents)} documents trouvés pour {category}")
+            logger.info("Extraction terminée: %s documents trouvés pour %s", len(documents), category)
             return documents
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'extraction des documents pour {category}: {e}")
+            logger.error("Erreur lors de l'extraction des documents pour %s: %s", category, e)
             return documents
     
-    def detect_available_languages(self, document_index: int) -> str:
+    def map_language_options(self, option_texts: List[str]) -> str:
+        """
+        Convertit les libellés d'options de langue en codes ISO
+
+        Args:
+            option_texts: Textes des options du dropdown de langue (ex: "English PDF")
+
+        Returns:
+            str: Codes de langues disponibles séparés par virgules (ex: "EN, FR, ES")
+        """
+        languages = set()
+        for option_text in option_texts:
+            # Un seul scan regex + lookup dict au lieu de 7 tests `in` par option
+            match = self._LANG_RE.search(option_text)
+            if match:
+                languages.add(self._LANG_MAP[match.group(1)])
+
+        # Ordre trié stable : l'ordre des options du dropdown ne peut plus
+        # déclencher de faux changements de langues dans compare_versions
+        return ", ".join(sorted(languages)) if languages else "EN"
+
+    def detect_available_languages(self, document_index: int,
+                                   language_selects: Optional[List] = None) -> str:
         """
         Détecteur automatique de langues via analyse des dropdowns de sélection
 
         Args:
             document_index: Position du document dans le DOM (0-indexé)
+            language_selects: Dropdowns déjà localisés ; si None, une recherche
+                est faite (les appelants en boucle doivent les passer pour
+                éviter un find_elements par document)
 
         Returns:
             str: Codes de langues disponibles séparés par virgules (ex: "EN, FR, ES")
         """
         try:
+            from selenium.webdriver.support.ui import Select  # Import paresseux
+
             # Localisation des dropdowns de langues par attribut spécialisé
-            language_selects = self.driver.find_elements(By.CSS_SELECTOR, "select[data-doc_idx]")
+            # (uniquement si l'appelant ne les a pas déjà récupérés)
+            if language_selects is None:
+                language_selects = self.driver.find_elements(*self._SEL_LANG_SELECT)
 
             if document_index < len(language_selects):
                 select_element = language_selects[document_index]
                 select = Select(select_element)
 
-                # Algorithme de parsing des options de langue
-                languages = []
-                for option in select.options:
-                    option_text = option.text.strip()
-                    if "PDF" in option_text:
-                        # Mapping des textes vers codes ISO de langues
-                        if "English PDF" in option_text:
-                            languages.append("EN")
-                        elif "French PDF" in option_text:
-                            languages.append("FR")
-                        elif "Chinese PDF" in option_text:
-                            languages.append("ZH")
-                        elif "German PDF" in option_text:
-                            languages.append("DE")
-                        elif "Japanese PDF" in option_text:
-                            languages.append("JA")
-                        elif "Portuguese PDF" in option_text:
-                            languages.append("PT")
-                        elif "Spanish PDF" in option_text:
-                            languages.append("ES")
-
-                return ", ".join(languages) if languages else "EN"
+                # Parsing des options via le mapping précompilé
+                return self.map_language_options([option.text for option in select.options])
             else:
-                # Stratégie de fallback : recherche par proximité DOM
+                # Stratégie de fallback : recherche par proximité DOM.
+                # closest()/querySelector s'exécutent nativement dans Blink en
+                # un seul aller-retour, là où la remontée XPath ../.. coûtait
+                # une marche d'arbre plus deux commandes WebDriver
                 try:
-                    document_elements = self.driver.find_elements(By.CSS_SELECTOR, "span.document_name")
+                    document_elements = self.driver.find_elements(*self._SEL_DOC_NAME)
                     if document_index < len(document_elements):
-                        # Navigation dans l'arbre DOM : recherche du select parent
-                        parent = document_elements[document_index].find_element(By.XPATH, "../..")
-                        select_element = parent.find_element(By.CSS_SELECTOR, "select")
-                        select = Select(select_element)
-
-                        # Parsing minimal pour le fallback
-                        languages = []
-                        for option in select.options:
-                            option_text = option.text.strip()
-                            if "English PDF" in option_text:
-                                languages.append("EN")
-                            elif "French PDF" in option_text:
-                                languages.append("FR")
-                            # Extension possible pour autres langues
-
-                        return ", ".join(languages) if languages else "EN"
+                        option_texts = self.driver.execute_script(
+                            "const sel = arguments[0].closest('li, tr, div')?.querySelector('select');"
+                            "return sel ? Array.from(sel.options).map(o => o.text) : null;",
+                            document_elements[document_index]
+                        )
+                        if option_texts:
+                            # Parsing via le même mapping précompilé que le chemin principal
+                            return self.map_language_options(option_texts)
                 except:
                     pass
 
                 return "EN"  # Fallback ultime : anglais par défaut
                 
         except Exception as e:
-            logger.debug(f"Impossible de détecter les langues pour le document {document_index}: {e}")
+            logger.debug("Impossible de détecter les langues pour le document %s: %s", document_index, e)
             return "EN"  # Défaut à anglais en cas d'erreur
     
     def determine_precise_category(self, document_name: str, base_category: str) -> str:
@@ -299,16 +454,7 @@ class PCIDocumentScraper:
         Returns:
             str: Catégorie précise
         """
-        document_name_lower = document_name.lower()
-        
-        if base_category == "SAQ":
-            # Détecte les documents AOC (Attestation of Compliance)
-            if any(keyword in document_name_lower for keyword in ["aoc", "attestation of compliance", "attestation"]):
-                return "SAQ AOC"
-            else:
-                return "SAQ"
-        
-        return base_category
+        return _precise_category(document_name.lower(), base_category)
     
     def get_available_categories(self) -> List[str]:
         """
@@ -317,21 +463,29 @@ class PCIDocumentScraper:
         Returns:
             List[str]: Liste des catégories disponibles
         """
+        # Les options du dropdown ne changent pas au cours d'une session :
+        # une seule interrogation du DOM, puis lecture du cache
+        if self._cached_categories is not None:
+            return self._cached_categories
+
         try:
-            select_element = self.driver.find_element(By.CSS_SELECTOR, "#document_category")
+            from selenium.webdriver.support.ui import Select  # Import paresseux
+
+            select_element = self.driver.find_element(*self._SEL_CATEGORY)
             select = Select(select_element)
-            
+
             categories = []
             for option in select.options:
                 option_text = option.text.strip()
                 if option_text and option_text != "Select Category":
                     categories.append(option_text)
-            
-            logger.info(f"Catégories disponibles détectées: {categories}")
+
+            logger.info("Catégories disponibles détectées: %s", categories)
+            self._cached_categories = categories
             return categories
             
         except Exception as e:
-            logger.error(f"Erreur lors de la détection des catégories: {e}")
+            logger.error("Erreur lors de la détection des catégories: %s", e)
             # Fallback vers les catégories connues
             return ["PCI DSS", "SAQ"]
     
@@ -355,46 +509,60 @@ class PCIDocumentScraper:
             categories = self.get_available_categories()
 
             # Filtrage intelligent des catégories pertinentes PCI DSS/SAQ
-            target_categories = []
-            for category in categories:
-                category_lower = category.lower()
-                if any(keyword in category_lower for keyword in ['pci', 'dss', 'saq', 'aoc', 'attestation']):
-                    target_categories.append(category)
+            target_categories = [
+                category for category in categories
+                if _CAT_RE.search(category.lower())
+            ]
 
             # Stratégie de fallback avec catégories prédéfinies
             if not target_categories:
                 target_categories = ["PCI DSS", "SAQ"]
                 logger.warning("Aucune catégorie pertinente détectée, utilisation des catégories par défaut")
             
-            logger.info(f"Catégories cibles à traiter: {target_categories}")
-
-            # Boucle de traitement séquentiel par catégorie
-            for category in target_categories:
-                logger.info(f"Traitement de la catégorie: {category}")
-
-                # Pipeline par catégorie : Filtrage -> Extraction -> Agrégation
-                if self.select_filter(category):
-                    documents = self.extract_documents(category)
-                    all_documents.extend(documents)
+            logger.info("Catégories cibles à traiter: %s", target_categories)
 
-                    logger.info(f"Documents extraits pour {category}: {len(documents)}")
-                else:
-                    logger.error(f"Impossible de sélectionner le filtre pour {category}")
+            # Scraping parallèle : les catégories sont indépendantes, chaque
+            # worker du pool possède son propre Chrome headless
+            if len(target_categories) > 1:
+                try:
+                    pool_size = min(len(target_categories), os.cpu_count() or 1)
+                    with multiprocessing.Pool(pool_size) as pool:
+                        results = pool.map(_scrape_one_category, target_categories)
+                    all_documents = list(itertools.chain.from_iterable(results))
+                except Exception as e:
+                    logger.warning("Scraping parallèle indisponible (%s), repli en séquentiel", e)
+                    all_documents = self._scrape_categories_sequential(target_categories)
+            else:
+                all_documents = self._scrape_categories_sequential(target_categories)
 
-                # Délai inter-catégories pour éviter la surcharge du serveur
-                time.sleep(3)
-            
             # Mise en cache et finalisation
             self.documents = all_documents
-            logger.info(f"Scraping terminé: {len(all_documents)} documents au total")
+            logger.info("Scraping terminé: %s documents au total", len(all_documents))
 
             return all_documents
             
         except Exception as e:
-            logger.error(f"Erreur lors du scraping: {e}")
+            logger.error("Erreur lors du scraping: %s", e)
             return all_documents
-    
-    def load_previous_data(self, filename: str = "pci_documents.csv") -> Optional[pd.DataFrame]:
+
+    def _scrape_categories_sequential(self, target_categories: List[str]) -> List[Dict[str, str]]:
+        """Boucle de traitement séquentiel par catégorie sur le driver courant"""
+        all_documents = []
+        for category in target_categories:
+            logger.info("Traitement de la catégorie: %s", category)
+
+            # Pipeline par catégorie : Filtrage -> Extraction -> Agrégation
+            if self.select_filter(category):
+                documents = self.extract_documents(category)
+                all_documents.extend(documents)
+
+                logger.info("Documents extraits pour %s: %s", category, len(documents))
+            else:
+                logger.error("Impossible de sélectionner le filtre pour %s", category)
+
+        return all_documents
+
+    def load_previous_data(self, filename: str = "pci_documents.csv") -> Optional['pd.DataFrame']:
         """
         Charge les données précédentes depuis le fichier CSV
         
@@ -405,24 +573,44 @@ class PCIDocumentScraper:
             DataFrame des données précédentes ou None si le fichier n'existe pas
         """
         try:
-            csv_path = f"/Users/thomasmionnet/Desktop/pci-dss/scraping2/{filename}"
+            import pandas as pd  # Import paresseux (voir en-tête du module)
+
+            csv_path = str(DATA_DIR / filename)
+
+            # Snapshot parquet prioritaire : format binaire colonnaire, chargé
+            # sans parsing texte ni inférence de types (le CSV reste l'artefact
+            # lisible par un humain)
+            parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+            if os.path.exists(parquet_path):
+                try:
+                    df = pd.read_parquet(parquet_path)
+                    logger.info("Données précédentes chargées depuis: %s (%s documents)", parquet_path, len(df))
+                    return df
+                except Exception as e:
+                    logger.warning("Snapshot parquet illisible (%s), repli sur le CSV", e)
+
             if os.path.exists(csv_path):
                 df = pd.read_csv(csv_path, encoding='utf-8')
-                logger.info(f"Données précédentes chargées depuis: {csv_path} ({len(df)} documents)")
+                logger.info("Données précédentes chargées depuis: %s (%s documents)", csv_path, len(df))
                 return df
             else:
                 logger.info("Aucun fichier de données précédentes trouvé")
                 return None
         except Exception as e:
-            logger.error(f"Erreur lors du chargement des données précédentes: {e}")
+            logger.error("Erreur lors du chargement des données précédentes: %s", e)
             return None
     
-    def compare_versions(self, previous_data: Optional[pd.DataFrame]) -> Dict[str, List[Dict[str, str]]]:
+    def compare_versions(self, previous_data: Optional['pd.DataFrame'],
+                         current_df: Optional['pd.DataFrame'] = None) -> Dict[str, List[Dict[str, str]]]:
         """
         Moteur de comparaison avancé pour détection de changements multi-critères
 
         Args:
             previous_data: Dataset de référence (DataFrame pandas)
+            current_df: Dataset courant déjà sous forme de DataFrame ; si None,
+                il est construit depuis self.documents. Permet au mode
+                comparaison de passer le CSV lu tel quel, sans aller-retour
+                DataFrame -> liste de dicts -> DataFrame
 
         Returns:
             Dict structuré : 'new_documents', 'updated_versions', 'removed_documents', 'unchanged_documents'
@@ -438,79 +626,148 @@ class PCIDocumentScraper:
         # Cas spécial : première exécution (pas de données de référence)
         if previous_data is None:
             logger.info("Première exécution - tous les documents sont nouveaux")
-            changes['new_documents'] = self.documents.copy()
+            changes['new_documents'] = (current_df.to_dict('records')
+                                        if current_df is not None else self.documents.copy())
             return changes
 
         try:
+            import pandas as pd  # Import paresseux (voir en-tête du module)
+
             # Conversion des structures pour optimiser les comparaisons
-            current_df = pd.DataFrame(self.documents)
-
-            # Création d'index composites pour matching précis (nom + catégorie)
-            previous_dict = {}
-            for _, row in previous_data.iterrows():
-                key = f"{row['name']}_{row['category']}"
-                previous_dict[key] = {
-                    'name': row['name'],
-                    'version': row['version'],
-                    'category': row['category'],
-                    'available_languages': row.get('available_languages', 'EN')
-                }
+            # (construction colonnaire : pas d'inférence par enregistrement)
+            if current_df is None:
+                current_df = pd.DataFrame({
+                    key: [doc.get(key) for doc in self.documents]
+                    for key in ('name', 'version', 'category', 'available_languages')
+                })
+            else:
+                if 'available_languages' not in current_df.columns:
+                    current_df = current_df.copy()
+                    current_df['available_languages'] = 'EN'
+                current_df = current_df[['name', 'version', 'category', 'available_languages']]
+
+            # Total courant mémorisé pour le résumé du rapport (self.documents
+            # peut être vide quand le DataFrame est passé directement)
+            self._current_count = len(current_df)
+
+            # Normalisation du dataset de référence (colonne langues optionnelle)
+            previous_df = previous_data.copy()
+            if 'available_languages' not in previous_df.columns:
+                previous_df['available_languages'] = 'EN'
+            previous_df = previous_df[['name', 'category', 'version', 'available_languages']]
+
+            # Fast path pour le cas nominal du run nocturne (aucun changement) :
+            # si les empreintes des deux snapshots coïncident, tout est inchangé
+            # et la jointure complète est inutile
+            def _df_rows(df):
+                return [
+                    (str(name), str(category), str(version),
+                     'EN' if pd.isna(langs) else str(langs))
+                    for name, category, version, langs in zip(
+                        df['name'], df['category'], df['version'], df['available_languages'])
+                ]
+
+            if _documents_digest(_df_rows(current_df)) == _documents_digest(_df_rows(previous_df)):
+                logger.info("Snapshots identiques (empreinte) - aucun changement")
+                changes['unchanged_documents'] = (self.documents.copy() if self.documents
+                                                  else current_df.to_dict('records'))
+                return changes
+
+            # Jointure externe vectorisée sur (nom, catégorie) : le diff complet
+            # s'effectue en un hash-join C-level au lieu d'itérations Python
+            merged = current_df.merge(
+                previous_df,
+                on=['name', 'category'],
+                how='outer',
+                suffixes=('_new', '_old'),
+                indicator=True
+            )
+
+            new_mask = merged['_merge'] == 'left_only'
+            removed_mask = merged['_merge'] == 'right_only'
+            both_mask = merged['_merge'] == 'both'
+
+            # Classification des changements par masques booléens : les champs
+            # comparés (version + langues) sont réduits à un hash uint64 par
+            # côté, la détection devient une seule égalité d'entiers par ligne
+            hash_new = pd.util.hash_pandas_object(
+                pd.DataFrame({
+                    'version': merged['version_new'],
+                    'languages': merged['available_languages_new'].fillna('EN'),
+                }), index=False
+            )
+            hash_old = pd.util.hash_pandas_object(
+                pd.DataFrame({
+                    'version': merged['version_old'],
+                    'languages': merged['available_languages_old'].fillna('EN'),
+                }), index=False
+            )
+            updated_mask = both_mask & (hash_new.values != hash_old.values)
+            unchanged_mask = both_mask & ~updated_mask
+
+            # Nouveaux documents (présents uniquement côté courant)
+            changes['new_documents'] = merged.loc[
+                new_mask, ['name', 'version_new', 'category', 'available_languages_new']
+            ].rename(columns={
+                'version_new': 'version',
+                'available_languages_new': 'available_languages'
+            }).to_dict('records')
+            for doc in changes['new_documents']:
+                logger.info("📄 Nouveau document: %s (%s)", doc['name'], doc['category'])
+
+            # Versions/langues mises à jour (présents des deux côtés, différents)
+            updated_df = merged.loc[
+                updated_mask,
+                ['name', 'category', 'version_old', 'version_new',
+                 'available_languages_old', 'available_languages_new']
+            ].rename(columns={
+                'version_old': 'old_version',
+                'version_new': 'new_version',
+                'available_languages_old': 'old_languages',
+                'available_languages_new': 'new_languages'
+            })
+            updated_df['old_languages'] = updated_df['old_languages'].fillna('EN')
+            updated_df['new_languages'] = updated_df['new_languages'].fillna('EN')
+            changes['updated_versions'] = updated_df.to_dict('records')
+            for change_info in changes['updated_versions']:
+                version_changed = change_info['old_version'] != change_info['new_version']
+                languages_changed = change_info['old_languages'] != change_info['new_languages']
+                if version_changed and languages_changed:
+                    logger.info("Version et langues mises à jour: %s (%s) - %s → %s, Langues: %s → %s", change_info['name'], change_info['category'], change_info['old_version'], change_info['new_version'], change_info['old_languages'], change_info['new_languages'])
+                elif version_changed:
+                    logger.info("Version mise à jour: %s (%s) - %s → %s", change_info['name'], change_info['category'], change_info['old_version'], change_info['new_version'])
+                else:
+                    logger.info("Langues disponibles mises à jour: %s (%s) - %s → %s", change_info['name'], change_info['category'], change_info['old_languages'], change_info['new_languages'])
+
+            # Documents inchangés (mêmes version et langues)
+            changes['unchanged_documents'] = merged.loc[
+                unchanged_mask, ['name', 'version_new', 'category', 'available_languages_new']
+            ].rename(columns={
+                'version_new': 'version',
+                'available_languages_new': 'available_languages'
+            }).to_dict('records')
+
+            # Documents supprimés (présents uniquement côté référence)
+            changes['removed_documents'] = merged.loc[
+                removed_mask, ['name', 'version_old', 'category', 'available_languages_old']
+            ].rename(columns={
+                'version_old': 'version',
+                'available_languages_old': 'available_languages'
+            }).to_dict('records')
+            for doc in changes['removed_documents']:
+                logger.info("Document supprimé: %s (%s)", doc['name'], doc['category'])
 
-            current_dict = {}
-            for doc in self.documents:
-                key = f"{doc['name']}_{doc['category']}"
-                current_dict[key] = doc
-            
-            # Détecte les nouveaux documents
-            for key, doc in current_dict.items():
-                if key not in previous_dict:
-                    changes['new_documents'].append(doc)
-                    logger.info(f"📄 Nouveau document: {doc['name']} ({doc['category']})")
-            
-            # Détecte les versions mises à jour et les changements de langues
-            for key, doc in current_dict.items():
-                if key in previous_dict:
-                    prev_doc = previous_dict[key]
-                    version_changed = doc['version'] != prev_doc['version']
-                    languages_changed = doc.get('available_languages', 'EN') != prev_doc.get('available_languages', 'EN')
-                    
-                    if version_changed or languages_changed:
-                        change_info = {
-                            'name': doc['name'],
-                            'category': doc['category'],
-                            'old_version': prev_doc['version'],
-                            'new_version': doc['version'],
-                            'old_languages': prev_doc.get('available_languages', 'EN'),
-                            'new_languages': doc.get('available_languages', 'EN')
-                        }
-                        changes['updated_versions'].append(change_info)
-                        
-                        if version_changed and languages_changed:
-                            logger.info(f"Version et langues mises à jour: {doc['name']} ({doc['category']}) - {prev_doc['version']} → {doc['version']}, Langues: {prev_doc.get('available_languages', 'EN')} → {doc.get('available_languages', 'EN')}")
-                        elif version_changed:
-                            logger.info(f"Version mise à jour: {doc['name']} ({doc['category']}) - {prev_doc['version']} → {doc['version']}")
-                        elif languages_changed:
-                            logger.info(f"Langues disponibles mises à jour: {doc['name']} ({doc['category']}) - {prev_doc.get('available_languages', 'EN')} → {doc.get('available_languages', 'EN')}")
-                    else:
-                        changes['unchanged_documents'].append(doc)
-            
-            # Détecte les documents supprimés
-            for key, doc in previous_dict.items():
-                if key not in current_dict:
-                    changes['removed_documents'].append(doc)
-                    logger.info(f"Document supprimé: {doc['name']} ({doc['category']})")
-            
             # Résumé des changements
-            logger.info(f"\nRésumé des changements:")
-            logger.info(f"  • Nouveaux documents: {len(changes['new_documents'])}")
-            logger.info(f"  • Versions mises à jour: {len(changes['updated_versions'])}")
-            logger.info(f"  • Documents supprimés: {len(changes['removed_documents'])}")
-            logger.info(f"  • Documents inchangés: {len(changes['unchanged_documents'])}")
+            logger.info("\nRésumé des changements:")
+            logger.info("  • Nouveaux documents: %s", len(changes['new_documents']))
+            logger.info("  • Versions mises à jour: %s", len(changes['updated_versions']))
+            logger.info("  • Documents supprimés: %s", len(changes['removed_documents']))
+            logger.info("  • Documents inchangés: %s", len(changes['unchanged_documents']))
             
             return changes
             
         except Exception as e:
-            logger.error(f"Erreur lors de la comparaison des versions: {e}")
+            logger.error("Erreur lors de la comparaison des versions: %s", e)
             return changes
     
     def save_changes_report(self, changes: Dict[str, List[Dict[str, str]]], timestamp: str = None):
@@ -526,68 +783,82 @@ class PCIDocumentScraper:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             report_filename = f"changes_report_{timestamp}.txt"
-            report_path = f"/Users/thomasmionnet/Desktop/pci-dss/scraping2/{report_filename}"
+            report_path = str(DATA_DIR / report_filename)
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(f"=== RAPPORT DE CHANGEMENTS PCI DSS/SAQ ===\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                # Nouveaux documents
-                if changes['new_documents']:
-                    f.write(f"📄 NOUVEAUX DOCUMENTS ({len(changes['new_documents'])}):\n")
-                    f.write("-" * 50 + "\n")
-                    for doc in changes['new_documents']:
-                        f.write(f"• {doc['name']} ({doc['category']}) - {doc['version']}\n")
-                    f.write("\n")
-                
-                # Versions mises à jour
-                if changes['updated_versions']:
-                    f.write(f"VERSIONS/LANGUES MISES À JOUR ({len(changes['updated_versions'])}):\n")
-                    f.write("-" * 50 + "\n")
-                    for change in changes['updated_versions']:
-                        f.write(f"• {change['name']} ({change['category']})\n")
-                        f.write(f"  Ancienne version: {change['old_version']}\n")
-                        f.write(f"  Nouvelle version: {change['new_version']}\n")
-                        if 'old_languages' in change and 'new_languages' in change:
-                            if change['old_languages'] != change['new_languages']:
-                                f.write(f"  Anciennes langues: {change['old_languages']}\n")
-                                f.write(f"  Nouvelles langues: {change['new_languages']}\n")
-                        f.write("\n")
-                
-                # Documents supprimés
-                if changes['removed_documents']:
-                    f.write(f"DOCUMENTS SUPPRIMÉS ({len(changes['removed_documents'])}):\n")
-                    f.write("-" * 50 + "\n")
-                    for doc in changes['removed_documents']:
-                        f.write(f"• {doc['name']} ({doc['category']}) - {doc['version']}\n")
-                    f.write("\n")
-                
-                # Résumé
-                total_changes = len(changes['new_documents']) + len(changes['updated_versions']) + len(changes['removed_documents'])
-                f.write(f"RÉSUMÉ:\n")
-                f.write("-" * 50 + "\n")
-                f.write(f"Total des changements détectés: {total_changes}\n")
-                f.write(f"Documents inchangés: {len(changes['unchanged_documents'])}\n")
-                f.write(f"Total des documents actuels: {len(self.documents)}\n")
+            # Assemble le rapport en mémoire puis l'écrit en un seul appel :
+            # évite un write() système par ligne
+            parts = [
+                "=== RAPPORT DE CHANGEMENTS PCI DSS/SAQ ===\n",
+                f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            ]
+
+            # Nouveaux documents
+            if changes['new_documents']:
+                parts.append(f"📄 NOUVEAUX DOCUMENTS ({len(changes['new_documents'])}):\n")
+                parts.append("-" * 50 + "\n")
+                for doc in changes['new_documents']:
+                    parts.append(f"• {doc['name']} ({doc['category']}) - {doc['version']}\n")
+                parts.append("\n")
+
+            # Versions mises à jour
+            if changes['updated_versions']:
+                parts.append(f"VERSIONS/LANGUES MISES À JOUR ({len(changes['updated_versions'])}):\n")
+                parts.append("-" * 50 + "\n")
+                for change in changes['updated_versions']:
+                    parts.append(f"• {change['name']} ({change['category']})\n")
+                    parts.append(f"  Ancienne version: {change['old_version']}\n")
+                    parts.append(f"  Nouvelle version: {change['new_version']}\n")
+                    if 'old_languages' in change and 'new_languages' in change:
+                        if change['old_languages'] != change['new_languages']:
+                            parts.append(f"  Anciennes langues: {change['old_languages']}\n")
+                            parts.append(f"  Nouvelles langues: {change['new_languages']}\n")
+                    parts.append("\n")
+
+            # Documents supprimés
+            if changes['removed_documents']:
+                parts.append(f"DOCUMENTS SUPPRIMÉS ({len(changes['removed_documents'])}):\n")
+                parts.append("-" * 50 + "\n")
+                for doc in changes['removed_documents']:
+                    parts.append(f"• {doc['name']} ({doc['category']}) - {doc['version']}\n")
+                parts.append("\n")
+
+            # Résumé
+            total_changes = len(changes['new_documents']) + len(changes['updated_versions']) + len(changes['removed_documents'])
+            parts.append("RÉSUMÉ:\n")
+            parts.append("-" * 50 + "\n")
+            parts.append(f"Total des changements détectés: {total_changes}\n")
+            parts.append(f"Documents inchangés: {len(changes['unchanged_documents'])}\n")
+            # self.documents peut être vide quand compare_versions a reçu le
+            # DataFrame directement ; le total est alors celui mémorisé
+            total_current = self._current_count if self._current_count is not None else len(self.documents)
+            parts.append(f"Total des documents actuels: {total_current}\n")
+
+            # Tampon d'1 Mo : le rapport assemblé part en un write système
+            with open(report_path, 'w', buffering=1 << 20, encoding='utf-8') as f:
+                f.write("".join(parts))
             
-            logger.info(f"Rapport de changements sauvegardé dans: {report_path}")
+            logger.info("Rapport de changements sauvegardé dans: %s", report_path)
             
         except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde du rapport: {e}")
+            logger.error("Erreur lors de la sauvegarde du rapport: %s", e)
     
-    def save_to_csv(self, filename: str = "pci_documents.csv", backup_previous: bool = True):
+    def save_to_csv(self, filename: str = "pci_documents.csv", backup_previous: bool = True,
+                    verbose: bool = True):
         """
         Sauvegarde les documents extraits dans un fichier CSV
-        
+
         Args:
             filename: Nom du fichier CSV de sortie
             backup_previous: Si True, sauvegarde l'ancien fichier avant écrasement
+            verbose: Si True, affiche l'aperçu et les statistiques détaillées
         """
         try:
             if not self.documents:
                 logger.warning("Aucun document à sauvegarder")
                 return
-            
+
+            import pandas as pd  # Import paresseux (voir en-tête du module)
+
             # Utilise le répertoire courant plutôt qu'un chemin codé en dur
             csv_path = filename
             
@@ -601,78 +872,161 @@ class PCIDocumentScraper:
                 except Exception as e:
                     old_count = "Unknown"
                     old_updated = "Unknown"
-                    logger.warning(f"Impossible de lire les métadonnées de l'ancien fichier: {e}")
+                    logger.warning("Impossible de lire les métadonnées de l'ancien fichier: %s", e)
                 
                 # Crée le nom de backup avec timestamp
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_filename = f"pci_documents_backup_{timestamp}.csv"
                 backup_path = backup_filename
                 
-                # Copie le fichier
-                shutil.copy2(csv_path, backup_path)
-                logger.info(f"✅ Backup créé: {backup_filename}")
-                logger.info(f"   📊 Ancienne version: {old_count} documents (dernière MAJ: {old_updated})")
-                logger.info(f"   📊 Nouvelle version: {len(self.documents)} documents")
-            
-            # Crée un DataFrame pandas
-            df = pd.DataFrame(self.documents)
-            
-            # Ajoute un timestamp
-            df['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Sauvegarde en CSV
-            df.to_csv(csv_path, index=False, encoding='utf-8')
-            
-            logger.info(f"Documents sauvegardés dans: {csv_path}")
-            logger.info(f"Nombre de documents sauvegardés: {len(self.documents)}")
-            
-            # Affiche un aperçu des données avec statistiques détaillées
-            print("\n" + "="*70)
-            print("📋 APERÇU DES DONNÉES EXTRAITES")
-            print("="*70)
-            print(df.head(10))
-            
-            print(f"\n📊 STATISTIQUES GÉNÉRALES:")
-            print(f"Total documents: {len(df)}")
-            
-            print(f"\n🏷️ RÉPARTITION PAR CATÉGORIE:")
-            category_counts = df['category'].value_counts()
-            for category, count in category_counts.items():
-                percentage = (count / len(df)) * 100
-                print(f"  • {category}: {count} documents ({percentage:.1f}%)")
+                # Lien dur plutôt qu'une copie : instantané et sans I/O,
+                # repli sur une copie si le système de fichiers refuse
+                try:
+                    os.link(csv_path, backup_path)
+                except OSError:
+                    shutil.copy2(csv_path, backup_path)
+                logger.info("✅ Backup créé: %s", backup_filename)
+                logger.info("   📊 Ancienne version: %s documents (dernière MAJ: %s)", old_count, old_updated)
+                logger.info("   📊 Nouvelle version: %s documents", len(self.documents))
             
-            if 'available_languages' in df.columns:
-                print(f"\n🌐 LANGUES DISPONIBLES:")
-                lang_counts = df['available_languages'].value_counts()
-                for languages, count in lang_counts.head(10).items():  # Top 10 pour éviter trop d'affichage
-                    percentage = (count / len(df)) * 100
-                    print(f"  • {languages}: {count} documents ({percentage:.1f}%)")
-                
-                # Analyse des langues individuelles
-                all_languages = []
-                for lang_combo in df['available_languages']:
-                    if pd.notna(lang_combo):
-                        langs = [lang.strip() for lang in str(lang_combo).split(',')]
-                        all_languages.extend(langs)
-                
-                from collections import Counter
-                lang_counter = Counter(all_languages)
-                print(f"\n🗣️ COUVERTURE PAR LANGUE INDIVIDUELLE:")
-                for lang, count in lang_counter.most_common():
-                    percentage = (count / len(df)) * 100
-                    print(f"  • {lang}: {count} documents ({percentage:.1f}%)")
+            # Horodatage de mise à jour partagé par toutes les lignes
+            last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+            # Écriture CSV en streaming : les documents sont déjà des dicts aux
+            # clés connues, inutile de matérialiser un DataFrame pour les écrire
+            # Écriture dans un fichier temporaire puis renommage atomique :
+            # le CSV n'est jamais visible dans un état partiellement écrit
+            fieldnames = ['name', 'version', 'category', 'available_languages', 'last_updated']
+            tmp_path = csv_path + '.tmp'
+            # Tampon d'1 Mo : le CSV part en quelques write() système au lieu
+            # d'un par bloc de 8 Ko
+            with open(tmp_path, 'w', newline='', buffering=1 << 20, encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                for doc in self.documents:
+                    writer.writerow({**doc, 'last_updated': last_updated})
+            os.replace(tmp_path, csv_path)
+
+            # DataFrame conservé pour le snapshot parquet et les statistiques.
+            # Construction colonne par colonne (dict de listes) : pandas stocke
+            # les colonnes directement sans inférence enregistrement par
+            # enregistrement comme avec une liste de dicts
+            df = pd.DataFrame({
+                key: [doc.get(key) for doc in self.documents]
+                for key in ('name', 'version', 'category', 'available_languages')
+            })
+            df['last_updated'] = last_updated
+
+            # Snapshot parquet jumeau pour un rechargement rapide au prochain run
+            try:
+                df.to_parquet(os.path.splitext(csv_path)[0] + '.parquet', index=False)
+            except Exception as e:
+                logger.warning("Impossible d'écrire le snapshot parquet: %s", e)
+
+            # Empreinte du snapshot (même schéma que le fast path de
+            # compare_versions) : permet à un outillage externe de détecter
+            # un jeu identique sans relire le CSV
+            try:
+                digest = _documents_digest([
+                    (str(doc['name']), str(doc['category']), str(doc['version']),
+                     str(doc.get('available_languages') or 'EN'))
+                    for doc in self.documents
+                ])
+                with open(os.path.splitext(csv_path)[0] + '.hash', 'w') as hash_file:
+                    hash_file.write(digest + '\n')
+            except Exception as e:
+                logger.warning("Impossible d'écrire l'empreinte du snapshot: %s", e)
+
+            logger.info("Documents sauvegardés dans: %s", csv_path)
+            logger.info("Nombre de documents sauvegardés: %s", len(self.documents))
             
-            print("="*70)
+            # Aperçu et statistiques uniquement en mode verbeux : les runs
+            # planifiés (cron/CI) s'épargnent value_counts + formatage
+            if verbose:
+                # Affiche un aperçu des données avec statistiques détaillées.
+                # Les lignes sont accumulées puis émises en un seul write : un
+                # appel stdio (et un flush) au lieu d'un par print
+                buf = ["", "=" * 70, "📋 APERÇU DES DONNÉES EXTRAITES", "=" * 70]
+                # to_string évite le __repr__ complet (lookups display.*, troncature)
+                # et supprime la colonne d'index trompeuse de l'aperçu
+                buf.append(df.iloc[:10].to_string(index=False))
+
+                # Dtype catégoriel : value_counts opère sur des codes entiers au
+                # lieu de hacher des chaînes (cardinalité bornée : PCI DSS, SAQ…)
+                df['category'] = df['category'].astype('category')
+
+                # Taille totale calculée une fois ; les pourcentages de chaque
+                # value_counts sont obtenus par une seule division vectorisée
+                total = len(df)
+                buf.append("\n📊 STATISTIQUES GÉNÉRALES:")
+                buf.append(f"Total documents: {total}")
+
+                # Gabarit de ligne pré-lié : la spec de format n'est parsée qu'une
+                # fois pour les trois boucles de statistiques
+                fmt_line = "  • {}: {} documents ({:.1f}%)".format
+
+                buf.append("\n🏷️ RÉPARTITION PAR CATÉGORIE:")
+                category_counts = df['category'].value_counts()
+                cat_pct = category_counts * (100.0 / total)
+                for category, count, percentage in zip(category_counts.index, category_counts.values, cat_pct.values):
+                    buf.append(fmt_line(category, count, percentage))
+
+                if 'available_languages' in df.columns:
+                    buf.append("\n🌐 LANGUES DISPONIBLES:")
+                    lang_counts = df['available_languages'].value_counts().head(10)  # Top 10 pour éviter trop d'affichage
+                    lang_pct = lang_counts * (100.0 / total)
+                    for languages, count, percentage in zip(lang_counts.index, lang_counts.values, lang_pct.values):
+                        buf.append(fmt_line(languages, count, percentage))
+
+                    # Analyse des langues individuelles : split/strip vectorisés
+                    # côté C via l'accesseur str + explode, comptage par kernel hashé
+                    lang_counter = (
+                        df['available_languages'].dropna().astype(str)
+                        .str.split(',').explode().str.strip().value_counts()
+                    )
+                    counter_pct = lang_counter * (100.0 / total)
+                    buf.append("\n🗣️ COUVERTURE PAR LANGUE INDIVIDUELLE:")
+                    for lang, count, percentage in zip(lang_counter.index, lang_counter.values, counter_pct.values):
+                        buf.append(fmt_line(lang, count, percentage))
+
+                buf.append("=" * 70)
+                sys.stdout.write("\n".join(buf) + "\n")
             
         except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde: {e}")
+            logger.error("Erreur lors de la sauvegarde: %s", e)
     
     def close(self):
-        """Ferme le driver Selenium"""
+        """Ferme le driver Selenium (idempotent)"""
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("Driver fermé")
 
+def _scrape_one_category(category: str) -> List[Dict[str, str]]:
+    """
+    Worker de pool : scrape une catégorie avec son propre Chrome headless
+
+    Args:
+        category: Catégorie cible ("PCI DSS", "SAQ", etc.)
+
+    Returns:
+        List[Dict]: Documents extraits pour la catégorie
+    """
+    scraper = PCIDocumentScraper(headless=True)
+    try:
+        # Profil Chrome isolé par worker pour éviter les collisions de verrou
+        scraper.setup_driver(user_data_dir=tempfile.mkdtemp(prefix="pci_chrome_"))
+        scraper.driver.get(scraper.url)
+        scraper.wait_for_page_load()
+
+        if scraper.select_filter(category):
+            return scraper.extract_documents(category)
+
+        logger.error("Impossible de sélectionner le filtre pour %s", category)
+        return []
+    finally:
+        scraper.close()
+
 def main():
     """Point d'entrée principal : orchestration complète du pipeline de détection de changements"""
     scraper = None
@@ -696,36 +1050,48 @@ def main():
             print("\nComparaison avec les données précédentes...")
             changes = scraper.compare_versions(previous_data)
             
-            # Sauvegarde les données avec backup
-            scraper.save_to_csv("pci_documents.csv", backup_previous=True)
-            
-            # Génère un rapport de changements si des changements sont détectés
-            total_changes = (len(changes['new_documents']) + 
-                           len(changes['updated_versions']) + 
-                           len(changes['removed_documents']))
-            
+            # Compteurs liés une seule fois, réutilisés par le test et l'affichage
+            new_n = len(changes['new_documents'])
+            upd_n = len(changes['updated_versions'])
+            rem_n = len(changes['removed_documents'])
+            total_changes = new_n + upd_n + rem_n
+
+            # Persistance (CSV + rapport) lancée en arrière-plan pendant que
+            # le driver Selenium se ferme : les deux fichiers sont indépendants
+            # (deux workers) et le teardown de Chrome recouvre l'écriture
+            # disque au lieu de s'y ajouter
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                persist_future = executor.submit(
+                    scraper.save_to_csv, "pci_documents.csv", True
+                )
+                report_future = (executor.submit(scraper.save_changes_report, changes, timestamp)
+                                 if total_changes > 0 else None)
+                scraper.close()  # s'exécute en parallèle de la persistance
+                persist_future.result()
+                if report_future is not None:
+                    report_future.result()
+
             if total_changes > 0:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                scraper.save_changes_report(changes, timestamp)
-                
-                print(f"\nCHANGEMENTS DÉTECTÉS!")
-                print(f"Nouveaux documents: {len(changes['new_documents'])}")
-                print(f"Versions mises à jour: {len(changes['updated_versions'])}")
-                print(f"Documents supprimés: {len(changes['removed_documents'])}")
-                print(f"Rapport détaillé sauvegardé dans: changes_report_{timestamp}.txt")
+                # Résumé émis en un seul print multi-lignes
+                print(f"\nCHANGEMENTS DÉTECTÉS!"
+                      f"\nNouveaux documents: {new_n}"
+                      f"\nVersions mises à jour: {upd_n}"
+                      f"\nDocuments supprimés: {rem_n}"
+                      f"\nRapport détaillé sauvegardé dans: changes_report_{timestamp}.txt")
             else:
-                print(f"\nAucun changement détecté depuis la dernière exécution")
-                print(f"📊 {len(changes['unchanged_documents'])} documents inchangés")
-            
-            print(f"\nScraping terminé avec succès!")
-            print(f"{len(documents)} documents extraits au total")
-            print(f"Données sauvegardées dans: pci_documents.csv")
+                print(f"\nAucun changement détecté depuis la dernière exécution"
+                      f"\n📊 {len(changes['unchanged_documents'])} documents inchangés")
+
+            print(f"\nScraping terminé avec succès!"
+                  f"\n{len(documents)} documents extraits au total"
+                  f"\nDonnées sauvegardées dans: pci_documents.csv")
             
         else:
             print("Aucun document n'a pu être extrait")
     
     except Exception as e:
-        logger.error(f"Erreur dans le programme principal: {e}")
+        logger.error("Erreur dans le programme principal: %s", e)
         print(f"Erreur: {e}")
     
     finally:
@@ -735,51 +1101,80 @@ def main():
 def main_comparison_only():
     """Fonction pour comparer uniquement les données existantes (sans scraping)"""
     try:
+        import pandas as pd  # Import paresseux (voir en-tête du module)
+
         print("Mode comparaison uniquement - Chargement des données...")
-        
-        # Charge les deux derniers fichiers CSV pour comparaison
-        csv_files = glob.glob("/Users/thomasmionnet/Desktop/pci-dss/scraping2/pci_documents*.csv")
-        csv_files.sort(key=os.path.getmtime, reverse=True)
-        
-        if len(csv_files) < 2:
+
+        # Charge les deux derniers fichiers CSV pour comparaison.
+        # os.scandir lit le mtime dans la même passe que le listage (un seul
+        # stat par entrée), là où glob + sort(key=getmtime) refaisait un stat
+        # par fichier lors du tri
+        with os.scandir(DATA_DIR) as it:
+            entries = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.startswith('pci_documents') and entry.name.endswith('.csv')
+            ]
+        entries.sort(reverse=True)
+
+        if len(entries) < 2:
             print("Il faut au moins 2 fichiers CSV pour effectuer une comparaison")
             return
-        
-        current_file = csv_files[0]
-        previous_file = csv_files[1]
+
+        current_file = entries[0][1]
+        previous_file = entries[1][1]
         
         print(f"Fichier actuel: {os.path.basename(current_file)}")
         print(f"Fichier précédent: {os.path.basename(previous_file)}")
         
-        current_data = pd.read_csv(current_file)
-        previous_data = pd.read_csv(previous_file)
+        # Seules les colonnes utilisées par compare_versions sont lues, en
+        # dtype str explicite : pas de parsing ni d'inférence sur le reste
+        # (last_updated, colonnes futures). L'en-tête est lu d'abord pour
+        # tolérer les anciens CSV sans available_languages
+        wanted_cols = ['name', 'version', 'category', 'available_languages']
+
+        def _read_comparison_csv(path):
+            header = pd.read_csv(path, nrows=0).columns
+            usecols = [col for col in wanted_cols if col in header]
+            # Parseur pyarrow (C++ multi-thread) quand il est disponible,
+            # repli silencieux sur le moteur C par défaut sinon
+            try:
+                return pd.read_csv(path, usecols=usecols, dtype=str,
+                                   encoding='utf-8', engine='pyarrow')
+            except (ImportError, ValueError):
+                return pd.read_csv(path, usecols=usecols, dtype=str, encoding='utf-8')
+
+        current_data = _read_comparison_csv(current_file)
+        previous_data = _read_comparison_csv(previous_file)
         
-        # Simule un scraper pour utiliser la méthode de comparaison
+        # Simule un scraper pour utiliser la méthode de comparaison ; le
+        # DataFrame courant est passé tel quel, sans matérialiser N dicts
         scraper = PCIDocumentScraper(headless=True)
-        scraper.documents = current_data.to_dict('records')
-        
-        changes = scraper.compare_versions(previous_data)
+        changes = scraper.compare_versions(previous_data, current_df=current_data)
         
         # Génère un rapport
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         scraper.save_changes_report(changes, f"comparison_{timestamp}")
         
-        total_changes = (len(changes['new_documents']) + 
-                        len(changes['updated_versions']) + 
-                        len(changes['removed_documents']))
-        
+        # Compteurs liés une seule fois, réutilisés par le test et l'affichage
+        new_n = len(changes['new_documents'])
+        upd_n = len(changes['updated_versions'])
+        rem_n = len(changes['removed_documents'])
+        total_changes = new_n + upd_n + rem_n
+
         if total_changes > 0:
-            print(f"\nCHANGEMENTS DÉTECTÉS!")
-            print(f"Nouveaux documents: {len(changes['new_documents'])}")
-            print(f"Versions mises à jour: {len(changes['updated_versions'])}")
-            print(f"Documents supprimés: {len(changes['removed_documents'])}")
+            # Résumé émis en un seul print multi-lignes
+            print(f"\nCHANGEMENTS DÉTECTÉS!"
+                  f"\nNouveaux documents: {new_n}"
+                  f"\nVersions mises à jour: {upd_n}"
+                  f"\nDocuments supprimés: {rem_n}")
         else:
             print(f"\nAucun changement détecté")
         
         print(f"Rapport sauvegardé dans: changes_report_comparison_{timestamp}.txt")
         
     except Exception as e:
-        logger.error(f"Erreur lors de la comparaison: {e}")
+        logger.error("Erreur lors de la comparaison: %s", e)
         print(f"Erreur: {e}")
 
 if __name__ == "__main__":
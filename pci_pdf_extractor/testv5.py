@@ -10,6 +10,100 @@ import json  # Export des données structurées en format JSON
 import PyPDF2  # Extraction de texte depuis fichiers PDF
 from typing import List, Dict, Any, Tuple  # Annotations de types pour robustesse du code
 
+# Regex précompilées au chargement du module : le parser repasse sur ces
+# patterns des milliers de fois par document, la compilation unique évite
+# le détour par le cache interne de `re` à chaque appel
+
+# Numérotation hiérarchique PCI DSS et annexes (ex: 1.2.3.4, A1.1.1, A2.1)
+_RE_REQ_NUM = re.compile(r'^((?:A\d+\.)?\d+(?:\.\d+)*)\s+')
+_RE_REQ_NUM_ML = re.compile(r'^((?:A\d+\.)?\d+(?:\.\d+)*)\s+', re.MULTILINE)
+_RE_FIRST_REQ = re.compile(r'^1\.1\.1\s+', re.MULTILINE)
+
+# Normalisation des espaces et des puces
+_RE_WS = re.compile(r'\s+')
+_RE_BULLET = re.compile(r'^•\s*')
+_RE_BLANK_LINES = re.compile(r'\n\s*\n')
+
+# Artefacts de mise en page SAQ (headers, copyrights, tableaux de réponse)
+_RE_SAQ_HEADER_BLOCK = re.compile(r'SAQ D de PCI DSS v[\d.]+.*?Page \d+.*?(?:En Place|Pas en Place)', re.DOTALL | re.IGNORECASE)
+_RE_COPYRIGHT_FULL = re.compile(r'© 2006-\d+.*?LLC.*?Tous Droits Réservés\.', re.IGNORECASE)
+_RE_PUB_DATE = re.compile(r'Octobre 2024', re.IGNORECASE)
+_RE_CROSS_REF_NL = re.compile(r'♦\s*Se reporter.*?(?=\n)', re.IGNORECASE)
+_RE_CHECKBOX = re.compile(r'\(Cocher une réponse.*?\)', re.IGNORECASE)
+_RE_SECTION_LABEL = re.compile(r'Section \d+ :', re.IGNORECASE)
+_RE_STATUS_HEADER = re.compile(r'En Place\s+En Place avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', re.IGNORECASE)
+_RE_STATUS_PARTIAL = re.compile(r'avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', re.IGNORECASE)
+_RE_STATUS_FRAGMENT = re.compile(r'avec CCW Non Applicable Non Testé Pas.*', re.IGNORECASE)
+
+# Alternation unique pour le nettoyage des tests et de la guidance : les
+# anciens pipelines appliquaient 6-8 re.sub successifs sur la même chaîne
+# (une traversée + une réallocation par pattern) ; une seule passe
+# gauche-droite suffit à éliminer tous les artefacts
+_RE_ARTIFACTS = re.compile('|'.join('(?:%s)' % p for p in [
+    r'SAQ D de PCI DSS.*?Page \d+.*',  # Headers/footers
+    r'© 2006-.*?LLC.*',  # Copyright notices
+    r'En Place\s+En Place avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place',  # Header complet tableau
+    r'avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place',  # Header partiel tableau
+    r'avec CCW Non Applicable Non Testé Pas.*',  # Fragments de tableau
+    r'En Place.*?Pas en Place',  # Range de statuts
+    r'(?:En Place|Pas en Place|Non Applicable|Non Testé|CCW)(?:\s+(?:En Place|Pas en Place|Non Applicable|Non Testé|CCW))*',  # Séquences de status
+    r'♦\s*Se reporter.*',  # Cross-références
+    r'\(Cocher une réponse[^)]*\)',  # Instructions utilisateur
+]), re.IGNORECASE)
+
+# Artefacts de cases de réponse du questionnaire (formulaire interactif)
+_RESPONSE_ARTIFACT_RES = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r'avec CCW Non Applicable Non Testé Pas.*?(?=\n|$)', # Fragments de tableau de statut
+        r'En Place\s+En Place avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', # Header complet tableau
+        r'avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', # Header partiel tableau
+        r'En Place.*?Pas en Place.*?(?=\n|$)', # Range de statuts
+        r'(En Place|Pas en Place|Non Applicable|Non Testé|CCW)(\s+(En Place|Pas en Place|Non Applicable|Non Testé|CCW))+', # Séquences multiples
+        r'♦\s*Se reporter.*?(?=\n|$)', # Cross-références avec symboles
+        r'\(Cocher une réponse.*?\)', # Instructions utilisateur
+    ]
+]
+
+# Tests intégrés dans le texte : une alternation unique sur les cinq verbes
+# d'action remplace cinq compilations + cinq balayages par ligne
+_RE_EMBEDDED_TEST = re.compile(r'•\s*(?:Examiner|Observer|Interroger|Vérifier|Inspecter)[^•]*', re.IGNORECASE)
+
+# Lignes de structure/habillage à ignorer pendant le parsing : une seule
+# alternation ancrée remplace les 17 re.match successifs par ligne
+_IGNORE_ALT = re.compile(''.join([
+    r'^(?:',
+    '|'.join([
+        r'SAQ D de PCI DSS',          # Headers de document
+        r'© 2006-\d+',                # Copyrights avec années
+        r'Page \d+',                  # Numéros de page
+        r'Octobre 2024',              # Dates de publication
+        r'Exigence de PCI DSS',       # Labels sections
+        r'Tests Prévus',              # Headers de test
+        r'Réponse',                   # Headers de réponse
+        r'En Place',                  # Statuts de conformité
+        r'Pas en Place',
+        r'Non Applicable',
+        r'Non Testé',
+        r'♦ Se reporter',             # Cross-références
+        r'\(Cocher une réponse',      # Instructions UI
+        r'Section \d+',               # Numérotation sections
+        r'Tous Droits Réservés',      # Mentions légales
+        r'LLC\.',                     # Suffixes entreprise
+        r'PCI Security Standards Council',  # Nom organisation
+    ]),
+    r')',
+]), re.IGNORECASE)
+
+# Version du parser pour la clé de cache disque : à incrémenter quand la
+# logique d'extraction change, afin d'invalider les résultats mémorisés
+_CACHE_VERSION = 'v5.1'
+
+# Pré-filtre littéral : premiers caractères possibles des patterns ci-dessus
+# (les deux casses) — un startswith C-level écarte ~90% des lignes normales
+# avant même d'invoquer le moteur regex
+_IGNORE_PREFIX = ('S', 's', '©', 'P', 'p', 'O', 'o', 'E', 'e', 'T', 't',
+                  'R', 'r', 'N', 'n', '♦', '(', 'L', 'l')
+
 class PCIRequirementsExtractor:
     """
     Extracteur spécialisé pour documents PCI DSS français avec parsing intelligent
@@ -19,28 +113,91 @@ class PCIRequirementsExtractor:
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path  # Chemin vers le fichier PDF source
         self.requirements = []    # Cache des exigences extraites avec métadonnées
+        self._pages_text = None   # Cache du texte par page (PDF parsé une seule fois)
 
         # Patterns de reconnaissance spécifiques au français pour les procédures de test
         self.test_indicators = ['• Examiner', '• Observer', '• Interroger', '• Vérifier', '• Inspecter']
+        # Tuple équivalent : str.startswith teste les 5 préfixes en C en un seul appel
+        self._test_indicator_tuple = tuple(self.test_indicators)
 
         # Marqueurs de sections spécialisées (terminologie française officielle PCI DSS)
         self.applicability_marker = "Notes d'Applicabilité"  # Section notes d'applicabilité
         self.guidance_marker = "Conseils"                   # Section conseils/guidance
+        # Tuple des deux marqueurs pour les conditions d'arrêt des boucles d'agrégation
+        self._section_prefixes = (self.applicability_marker, self.guidance_marker)
+        # Longueurs des marqueurs calculées une fois pour le découpage en boucle chaude
+        self._appl_len = len(self.applicability_marker)
+        self._guide_len = len(self.guidance_marker)
+
+    def _load_pages(self) -> List[str]:
+        """Charge et met en cache le texte de toutes les pages du PDF
+
+        L'extraction de texte est le coût dominant de PyPDF2 : le document
+        n'est ouvert et parsé qu'une seule fois, puis la détection des
+        boundaries et la lecture du contenu travaillent sur ce cache.
+        """
+        if self._pages_text is None:
+            self._pages_text = self._extract_all_pages_text()
+        return self._pages_text
 
-    def find_start_page(self) -> int:
-        """Détecteur automatique de page de début par recherche pattern 1.1.1"""
+    def _extract_all_pages_text(self) -> List[str]:
+        """Extrait le texte de chaque page avec le backend le plus rapide disponible
+
+        pypdfium2 (bindings C de PDFium) est utilisé s'il est installé :
+        son extraction est d'un ordre de grandeur plus rapide que PyPDF2
+        sur les PDF SAQ typiques. PyPDF2 reste le fallback pur-Python.
+        """
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            import pypdfium2 as pdfium  # Dépendance optionnelle
+        except ImportError:
+            pdfium = None
+
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(self.pdf_path)
+            try:
+                return [page.get_textpage().get_text_range() for page in pdf]
+            finally:
+                pdf.close()
+
+        # Fallback pur-Python avec PyPDF2
+        with open(self.pdf_path, 'rb') as file:
+            data = file.read()
+
+        import io
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+        n_pages = len(pdf_reader.pages)
+
+        # Petits documents : le coût de démarrage des threads ne se justifie pas
+        if n_pages <= 8:
+            return [page.extract_text() or '' for page in pdf_reader.pages]
 
-                # Balayage séquentiel pour localiser la première exigence PCI DSS (1.1.1)
-                for page_num in range(len(pdf_reader.pages)):
-                    page_text = pdf_reader.pages[page_num].extract_text()
+        # Extraction parallèle par plages de pages : chaque worker reçoit son
+        # propre PdfReader sur le buffer partagé (les seeks concurrents sur un
+        # même flux ne sont pas sûrs avec PyPDF2)
+        import os
+        from concurrent.futures import ThreadPoolExecutor
 
-                    # Pattern matching : recherche de "1.1.1" en début de ligne
-                    if re.search(r'^1\.1\.1\s+', page_text, re.MULTILINE):
-                        print(f"Page de début détectée: {page_num + 1} (contient 1.1.1)")
-                        return page_num
+        workers = min(os.cpu_count() or 1, n_pages)
+        bounds = [(k * n_pages // workers, (k + 1) * n_pages // workers) for k in range(workers)]
+
+        def _extract_range(bound):
+            reader = PyPDF2.PdfReader(io.BytesIO(data))
+            return [reader.pages[i].extract_text() or '' for i in range(bound[0], bound[1])]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_extract_range, bounds)
+
+        return [page_text for chunk in chunks for page_text in chunk]
+
+    def find_start_page(self) -> int:
+        """Détecteur automatique de page de début par recherche pattern 1.1.1"""
+        try:
+            # Balayage séquentiel pour localiser la première exigence PCI DSS (1.1.1)
+            for page_num, page_text in enumerate(self._load_pages()):
+                # Pattern matching : recherche de "1.1.1" en début de ligne
+                if _RE_FIRST_REQ.search(page_text):
+                    print(f"Page de début détectée: {page_num + 1} (contient 1.1.1)")
+                    return page_num
 
         except Exception as e:
             print(f"Erreur lors de la recherche de la page de début: {e}")
@@ -52,44 +209,40 @@ class PCIRequirementsExtractor:
     def find_end_page(self) -> int:
         """Algorithme de détection de fin basé sur la hiérarchie des exigences PCI DSS et annexes"""
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                highest_requirement = ""
-                end_page = len(pdf_reader.pages) - 1
-
-                # Pattern pour numérotation hiérarchique PCI DSS et annexes (ex: 12.3.4.1, A1.1.1, A2.1.1, A1.1, A2.1)
-                pattern = r'^((?:A\d+\.)?\d+(?:\.\d+)*)\s+'
-
-                # Balayage complet pour identifier la dernière exigence valide
-                for page_num in range(len(pdf_reader.pages)):
-                    page_text = pdf_reader.pages[page_num].extract_text()
-                    matches = re.findall(pattern, page_text, re.MULTILINE)
-
-                    for match in matches:
-                        # Validation : exigences PCI DSS principales (1-12) ou annexes (A1, A2, etc.)
-                        if match.startswith('A'):
-                            # Format annexe : A1.1.1, A2.1.1, A1.1, A2.1, etc.
-                            annexe_parts = match[1:].split('.')
-                            if len(annexe_parts) >= 1:  # Au minimum A1.1
-                                annexe_num = int(annexe_parts[0])
-                                if annexe_num >= 1:  # Accepter toutes les annexes valides
-                                    if self._is_higher_requirement(match, highest_requirement):
-                                        highest_requirement = match
-                                        end_page = page_num
-                        else:
-                            # Format standard : 1.1.1, 12.3.4, etc.
-                            parts = match.split('.')
-                            if len(parts) >= 2:
-                                main_num = int(parts[0])
-                                if 1 <= main_num <= 12:
-                                    # Comparaison hiérarchique pour trouver la plus haute exigence
-                                    if self._is_higher_requirement(match, highest_requirement):
-                                        highest_requirement = match
-                                        end_page = page_num
-
-                if highest_requirement:
-                    print(f"Page de fin détectée: {end_page + 1} (dernière exigence: {highest_requirement})")
-                    return end_page
+            pages = self._load_pages()
+
+            # Les exigences apparaissent en ordre croissant dans le document :
+            # balayage à rebours depuis la dernière page, arrêt dès la
+            # première page contenant une exigence valide (1-2 pages scannées
+            # en pratique au lieu de l'intégralité du document)
+            for page_num in range(len(pages) - 1, -1, -1):
+                page_best = ""
+                best_key = ()
+
+                for match in _RE_REQ_NUM_ML.findall(pages[page_num]):
+                    # Validation et clé de tri : tuple d'entiers préfixé d'un
+                    # drapeau annexe (les annexes viennent après les exigences
+                    # principales) — la comparaison de tuples est en C
+                    if match.startswith('A'):
+                        # Format annexe : A1.1.1, A2.1.1, A1.1, A2.1, etc.
+                        annexe_parts = match[1:].split('.')
+                        if not annexe_parts or int(annexe_parts[0]) < 1:
+                            continue
+                        key = (1,) + tuple(int(x) for x in annexe_parts)
+                    else:
+                        # Format standard : 1.1.1, 12.3.4, etc.
+                        parts = match.split('.')
+                        if len(parts) < 2 or not 1 <= int(parts[0]) <= 12:
+                            continue
+                        key = (0,) + tuple(int(x) for x in parts)
+
+                    if key > best_key:
+                        best_key = key
+                        page_best = match
+
+                if page_best:
+                    print(f"Page de fin détectée: {page_num + 1} (dernière exigence: {page_best})")
+                    return page_num
 
         except Exception as e:
             print(f"Erreur lors de la recherche de la page de fin: {e}")
@@ -98,65 +251,25 @@ class PCIRequirementsExtractor:
         print("Page de fin non trouvée, utilisation de la page 129 par défaut")
         return 128
     
-    def _is_higher_requirement(self, req1: str, req2: str) -> bool:
-        """Comparateur hiérarchique pour numérotation PCI DSS et annexes (ex: 12.3.4 > 12.3.3, A2.1.1 > A1.9.9)"""
-        if not req2:
-            return True
-
-        # Gestion des annexes vs exigences principales
-        req1_is_annexe = req1.startswith('A')
-        req2_is_annexe = req2.startswith('A')
-
-        # Les annexes viennent toujours après les exigences principales
-        if req1_is_annexe and not req2_is_annexe:
-            return True
-        if not req1_is_annexe and req2_is_annexe:
-            return False
-
-        # Extraction des parties numériques
-        if req1_is_annexe:
-            parts1 = [int(x) for x in req1[1:].split('.')]  # Supprime le 'A'
-        else:
-            parts1 = [int(x) for x in req1.split('.')]
-
-        if req2_is_annexe:
-            parts2 = [int(x) for x in req2[1:].split('.')]  # Supprime le 'A'
-        else:
-            parts2 = [int(x) for x in req2.split('.')]
-
-        # Normalisation des longueurs avec padding de zéros
-        max_len = max(len(parts1), len(parts2))
-        parts1.extend([0] * (max_len - len(parts1)))
-        parts2.extend([0] * (max_len - len(parts2)))
-
-        # Comparaison lexicographique des composants hiérarchiques
-        return parts1 > parts2
-
     def read_pdf_content(self) -> str:
         """Lecteur PDF intelligent avec détection automatique des boundaries d'extraction"""
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-
-                # Phase 1: Détection automatique des limites du document
-                start_page = self.find_start_page()
-                end_page = self.find_end_page()
+            pages = self._load_pages()
 
-                # Validation et correction des boundaries
-                if end_page <= start_page:
-                    end_page = min(len(pdf_reader.pages) - 1, start_page + 100)  # Limite sécurisée
-                    print(f"Ajustement de la page de fin à {end_page + 1}")
+            # Phase 1: Détection automatique des limites du document
+            # (opère sur le cache de pages, le PDF n'est pas relu)
+            start_page = self.find_start_page()
+            end_page = self.find_end_page()
 
-                print(f"Extraction des pages {start_page + 1} à {end_page + 1}")
+            # Validation et correction des boundaries
+            if end_page <= start_page:
+                end_page = min(len(pages) - 1, start_page + 100)  # Limite sécurisée
+                print(f"Ajustement de la page de fin à {end_page + 1}")
 
-                # Phase 2: Extraction séquentielle du texte brut
-                for page_num in range(start_page, end_page + 1):
-                    if page_num < len(pdf_reader.pages):
-                        page = pdf_reader.pages[page_num]
-                        text += page.extract_text() + "\n"
+            print(f"Extraction des pages {start_page + 1} à {end_page + 1}")
 
-            return text
+            # Phase 2: Assemblage du texte brut depuis le cache
+            return "\n".join(pages[start_page:end_page + 1]) + "\n"
         except Exception as e:
             print(f"Erreur lors de la lecture du PDF: {e}")
             return ""
@@ -164,32 +277,39 @@ class PCIRequirementsExtractor:
     def clean_text(self, text: str) -> str:
         """Système de nettoyage avancé pour suppression des artefacts SAQ français"""
         # Suppression des headers/footers récurrents du document SAQ
-        text = re.sub(r'SAQ D de PCI DSS v[\d.]+.*?Page \d+.*?(?:En Place|Pas en Place)', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = _RE_SAQ_HEADER_BLOCK.sub('', text)
 
         # Nettoyage des métadonnées de copyright et version
-        text = re.sub(r'© 2006-\d+.*?LLC.*?Tous Droits Réservés\.', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Octobre 2024', '', text, flags=re.IGNORECASE)
+        text = _RE_COPYRIGHT_FULL.sub('', text)
+        text = _RE_PUB_DATE.sub('', text)
 
         # Suppression des références croisées et instructions de navigation
-        text = re.sub(r'♦\s*Se reporter.*?(?=\n)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\(Cocher une réponse.*?\)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Section \d+ :', '', text, flags=re.IGNORECASE)
+        text = _RE_CROSS_REF_NL.sub('', text)
+        text = _RE_CHECKBOX.sub('', text)
+        text = _RE_SECTION_LABEL.sub('', text)
 
         # Nettoyage spécialisé des tableaux de conformité SAQ
-        text = re.sub(r'En Place\s+En Place avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'avec CCW Non Applicable Non Testé Pas.*', '', text, flags=re.IGNORECASE)
+        text = _RE_STATUS_HEADER.sub('', text)
+        text = _RE_STATUS_PARTIAL.sub('', text)
+        text = _RE_STATUS_FRAGMENT.sub('', text)
 
         # Normalisation des espaces et mise en forme
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # Consolidation des sauts de ligne
+        text = _RE_BLANK_LINES.sub('\n\n', text)  # Consolidation des sauts de ligne
         lines = [line.strip() for line in text.splitlines()]  # Trim de chaque ligne
         return "\n".join(lines)
 
     def is_requirement_number(self, line: str) -> str:
         """Validateur de numérotation hiérarchique PCI DSS et annexes avec validation de plage"""
+        s = line.strip()
+
+        # Garde rapide : seules les lignes commençant par un chiffre (exigence)
+        # ou 'A' (annexe) peuvent matcher — évite le dispatch regex sur la
+        # grande majorité des lignes (prose, tests, headers)
+        if not s or (not s[0].isdigit() and s[0] != 'A'):
+            return ""
+
         # Pattern regex pour structure hiérarchique standard et annexes (ex: 1.2.3.4, A1.1.1, A2.1.1, A1.1, A2.1)
-        pattern = r'^((?:A\d+\.)?\d+(?:\.\d+)*)\s+'
-        match = re.match(pattern, line.strip())
+        match = _RE_REQ_NUM.match(s)
         if match:
             req_num = match.group(1)
 
@@ -211,27 +331,30 @@ class PCIRequirementsExtractor:
 
     def is_test_line(self, line: str) -> bool:
         """Détecteur de procédures de test basé sur les verbes d'action français"""
-        line_clean = line.strip()
-        # Matching des indicateurs de test français PCI DSS
-        return any(line_clean.startswith(indicator) for indicator in self.test_indicators)
+        # Matching des indicateurs de test français PCI DSS (tuple de préfixes, test C-level)
+        return line.strip().startswith(self._test_indicator_tuple)
 
     def extract_requirement_text(self, line: str, req_num: str) -> str:
         """Extracteur de texte d'exigence avec suppression du préfixe numérique"""
-        # Pattern matching et suppression du numéro d'exigence + espaces
-        pattern = rf'^{re.escape(req_num)}\s+'
-        cleaned_line = re.sub(pattern, '', line.strip())
-        return cleaned_line
+        # is_requirement_number garantit que la ligne commence par req_num
+        # suivi d'espaces : un simple slicing remplace la regex recompilée
+        # à chaque exigence
+        return line.strip()[len(req_num):].lstrip()
 
     def parse_requirements(self, content: str) -> List[Dict[str, Any]]:
         """Parser principal avec machine à états pour extraction structurée des exigences PCI DSS"""
         requirements = []
-        lines = content.splitlines()
+        seen_nums = set()  # Numéros déjà finalisés : dédup O(1) au lieu d'un scan de la liste
+        # Strip unique à l'entrée : la machine à états et ses boucles internes
+        # relisaient chaque ligne jusqu'à quatre fois avec un .strip() à chaque
+        # passage — autant d'allocations évitées
+        lines = tuple(l.strip() for l in content.splitlines())
         i = 0
         current_req = None
 
         # Machine à états : ligne par ligne avec gestion contextuelle
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
 
             if not line:  # Skip des lignes vides
                 i += 1
@@ -243,8 +366,9 @@ class PCIRequirementsExtractor:
                 # Finalisation et sauvegarde de l'exigence précédente
                 if current_req:
                     self._finalize_requirement(current_req)
-                    if not any(req['req_num'] == current_req['req_num'] for req in requirements):
+                    if current_req['req_num'] not in seen_nums:
                         requirements.append(current_req)
+                        seen_nums.add(current_req['req_num'])
 
                 # Initialisation d'une nouvelle exigence avec structure complète
                 req_text = self.extract_requirement_text(line, req_num)
@@ -252,6 +376,7 @@ class PCIRequirementsExtractor:
                     'req_num': req_num,        # Numéro hiérarchique (ex: 1.2.3)
                     'text': req_text,          # Texte principal de l'exigence
                     'tests': [],               # Array des procédures de test
+                    '_test_set': set(),        # Miroir des tests pour dédup O(1) (retiré à la finalisation)
                     'guidance': ''             # Notes d'applicabilité et conseils
                 }
                 i += 1
@@ -262,13 +387,14 @@ class PCIRequirementsExtractor:
                 # État 2a: Détection et extraction de procédure de test
                 if self.is_test_line(line):
                     # Préservation du verbe d'action français (Examiner, Observer, etc.)
-                    test_text = line
-                    test_text = re.sub(r'^•\s*', '', test_text).strip()  # Suppression puce
+                    # Accumulation en liste : un seul join final au lieu d'une
+                    # réallocation de chaîne par ligne agrégée
+                    test_parts = [_RE_BULLET.sub('', line).strip()]  # Suppression puce
 
                     # Agrégation multi-lignes pour tests complexes
                     j = i + 1
                     while j < len(lines):
-                        next_line = lines[j].strip()
+                        next_line = lines[j]
                         if not next_line:
                             j += 1
                             continue
@@ -276,19 +402,19 @@ class PCIRequirementsExtractor:
                         # Conditions d'arrêt : nouvelle section détectée
                         if (self.is_requirement_number(next_line) or
                             self.is_test_line(next_line) or
-                            next_line.startswith(self.applicability_marker) or
-                            next_line.startswith(self.guidance_marker) or
+                            next_line.startswith(self._section_prefixes) or
                             self._should_ignore_line(next_line)):
                             break
 
                         # Continuation du test en cours
-                        test_text += " " + next_line
+                        test_parts.append(next_line)
                         j += 1
 
                     # Nettoyage et validation avant stockage
-                    test_text = self._clean_test_text(test_text)
+                    test_text = self._clean_test_text(" ".join(test_parts))
                     if test_text and len(test_text) > 10:  # Filtre des tests significatifs
                         current_req['tests'].append(test_text)
+                        current_req['_test_set'].add(test_text)
 
                     i = j
                     continue
@@ -296,10 +422,10 @@ class PCIRequirementsExtractor:
                 # État 2b: Extraction des Notes d'Applicabilité
                 elif line.startswith(self.applicability_marker):
                     # Extraction du contenu guidance avec agrégation multi-lignes
-                    guidance_text = line[len(self.applicability_marker):].strip(': ')
+                    guidance_parts = [line[self._appl_len:].lstrip(' :')]
                     j = i + 1
                     while j < len(lines):
-                        next_line = lines[j].strip()
+                        next_line = lines[j]
                         if not next_line:
                             j += 1
                             continue
@@ -311,20 +437,20 @@ class PCIRequirementsExtractor:
                             self._should_ignore_line(next_line)):
                             break
 
-                        guidance_text += " " + next_line
+                        guidance_parts.append(next_line)
                         j += 1
 
                     # Nettoyage et stockage dans le champ guidance
-                    current_req['guidance'] = self._clean_guidance_text(guidance_text)
+                    current_req['guidance'] = self._clean_guidance_text(" ".join(guidance_parts))
                     i = j
                     continue
 
                 # État 2c: Extraction de la section Conseils
                 elif line.startswith(self.guidance_marker):
-                    guidance_text = line[len(self.guidance_marker):].strip(': ')
+                    guidance_parts = [line[self._guide_len:].lstrip(' :')]
                     j = i + 1
                     while j < len(lines):
-                        next_line = lines[j].strip()
+                        next_line = lines[j]
                         if not next_line:
                             j += 1
                             continue
@@ -336,10 +462,10 @@ class PCIRequirementsExtractor:
                             self._should_ignore_line(next_line)):
                             break
 
-                        guidance_text += " " + next_line
+                        guidance_parts.append(next_line)
                         j += 1
 
-                    current_req['guidance'] = self._clean_guidance_text(guidance_text)
+                    current_req['guidance'] = self._clean_guidance_text(" ".join(guidance_parts))
                     i = j
                     continue
 
@@ -370,12 +496,13 @@ class PCIRequirementsExtractor:
         # Sauvegarder la dernière exigence
         if current_req:
             self._finalize_requirement(current_req)
-            if not any(req['req_num'] == current_req['req_num'] for req in requirements):
+            if current_req['req_num'] not in seen_nums:
                 requirements.append(current_req)
+                seen_nums.add(current_req['req_num'])
 
         return requirements
 
-    def _extract_tests_from_text_line_multiline(self, line: str, current_req: Dict[str, Any], all_lines: List[str], current_index: int) -> Tuple[str, int]:
+    def _extract_tests_from_text_line_multiline(self, line: str, current_req: Dict[str, Any], all_lines: Tuple[str, ...], current_index: int) -> Tuple[str, int]:
         """Extrait les tests cachés dans une ligne de texte et gère les tests multi-lignes
 
         Méthode avancée de détection et extraction des procédures de test intégrées
@@ -384,58 +511,58 @@ class PCIRequirementsExtractor:
         remaining_text = line
         processed_lines = current_index
 
-        # Scanner tous les indicateurs de test pour détection exhaustive
-        for indicator in self.test_indicators:
-            verb = indicator[2:]  # Extraction du verbe d'action français ("Examiner", "Observer", etc.)
-            pattern = rf'•\s*{re.escape(verb)}[^•]*'  # Pattern regex pour détecter le test avec puce
-            matches = list(re.finditer(pattern, remaining_text, re.IGNORECASE))  # Recherche insensible à la casse
-            
-            for match in reversed(matches):  # Traitement inverse pour préserver les positions des regex
-                test_text = match.group(0)
-                test_text = re.sub(r'^•\s*', '', test_text).strip()  # Suppression de la puce initiale
-
-                # Détection des tests incomplets nécessitant une agrégation multi-lignes
-                # Critères: longueur insuffisante ou absence de ponctuation finale
-                if len(test_text) < 30 or not test_text.endswith('.'):
-                    # Algorithme d'agrégation séquentielle pour tests multi-lignes
-                    j = current_index + 1
-                    while j < len(all_lines):  # Parcours des lignes suivantes
-                        next_line = all_lines[j].strip()
-                        if not next_line:
-                            j += 1
-                            continue
+        # Détection exhaustive en une seule passe : l'alternation précompilée
+        # couvre les cinq verbes d'action français
+        matches = list(_RE_EMBEDDED_TEST.finditer(remaining_text))
+
+        for match in reversed(matches):  # Traitement inverse pour préserver les positions des regex
+            test_text = _RE_BULLET.sub('', match.group(0)).strip()  # Suppression de la puce initiale
+
+            # Détection des tests incomplets nécessitant une agrégation multi-lignes
+            # Critères: longueur insuffisante ou absence de ponctuation finale
+            if len(test_text) < 30 or not test_text.endswith('.'):
+                # Agrégation séquentielle en liste (un seul join final)
+                test_parts = [test_text]
+                j = current_index + 1
+                while j < len(all_lines):  # Parcours des lignes suivantes (déjà strippées)
+                    next_line = all_lines[j]
+                    if not next_line:
+                        j += 1
+                        continue
 
-                        # Conditions d'arrêt : détection de nouvelles sections structurelles
-                        if (self.is_requirement_number(next_line) or   # Nouvelle exigence détectée
-                            self.is_test_line(next_line) or            # Nouveau test indépendant
-                            next_line.startswith(self.applicability_marker) or  # Section applicabilité
-                            next_line.startswith(self.guidance_marker) or       # Section conseils
-                            self._should_ignore_line(next_line)):       # Contenu non pertinent
-                            break
+                    # Conditions d'arrêt : détection de nouvelles sections structurelles
+                    if (self.is_requirement_number(next_line) or   # Nouvelle exigence détectée
+                        self.is_test_line(next_line) or            # Nouveau test indépendant
+                        next_line.startswith(self._section_prefixes) or  # Sections applicabilité/conseils
+                        self._should_ignore_line(next_line)):       # Contenu non pertinent
+                        break
 
-                        # Agrégation de la continuation avec espace séparateur
-                        test_text += " " + next_line
-                        processed_lines = j  # Marquage de ligne comme traitée pour éviter la redondance
+                    # Agrégation de la continuation avec espace séparateur
+                    test_parts.append(next_line)
+                    processed_lines = j  # Marquage de ligne comme traitée pour éviter la redondance
 
-                        # Détection de fin de phrase complète pour optimiser l'arrêt
-                        if next_line.endswith('.') or next_line.endswith('!') or next_line.endswith('?'):
-                            break  # Arrêt sur ponctuation terminale
+                    # Détection de fin de phrase complète pour optimiser l'arrêt
+                    if next_line.endswith('.') or next_line.endswith('!') or next_line.endswith('?'):
+                        break  # Arrêt sur ponctuation terminale
 
-                        j += 1
-                
-                # Pipeline de nettoyage pour suppression des artefacts PDF
-                test_text = self._clean_test_text(test_text)
+                    j += 1
 
-                if test_text and len(test_text) > 10:  # Filtre de qualité minimum
-                    # Déduplication automatique des tests identiques
-                    if test_text not in current_req['tests']:
-                        current_req['tests'].append(test_text)
+                test_text = " ".join(test_parts)
+
+            # Pipeline de nettoyage pour suppression des artefacts PDF
+            test_text = self._clean_test_text(test_text)
+
+            if test_text and len(test_text) > 10:  # Filtre de qualité minimum
+                # Déduplication automatique des tests identiques (set miroir O(1))
+                if test_text not in current_req['_test_set']:
+                    current_req['tests'].append(test_text)
+                    current_req['_test_set'].add(test_text)
+
+                # Suppression du segment test du texte principal (chirurgie de string)
+                remaining_text = remaining_text[:match.start()] + ' ' + remaining_text[match.end():]
 
-                    # Suppression du segment test du texte principal (chirurgie de string)
-                    remaining_text = remaining_text[:match.start()] + ' ' + remaining_text[match.end():]
-        
         # Normalisation finale : compression des espaces multiples
-        remaining_text = re.sub(r'\s+', ' ', remaining_text).strip()
+        remaining_text = _RE_WS.sub(' ', remaining_text).strip()
         return remaining_text, processed_lines  # Retourne le texte nettoyé + index de fin
 
     def _extract_tests_from_text_line(self, line: str, current_req: Dict[str, Any]) -> str:
@@ -445,27 +572,25 @@ class PCIRequirementsExtractor:
         """
         remaining_text = line
 
-        # Détection exhaustive des indicateurs de test dans la ligne
-        for indicator in self.test_indicators:
-            verb = indicator[2:]  # Extraction du verbe d'action français seul
-            pattern = rf'•\s*{re.escape(verb)}[^•]*'  # Pattern d'identification test avec puce
-            matches = list(re.finditer(pattern, remaining_text, re.IGNORECASE))  # Recherche insensible casse
-            
-            for match in reversed(matches):  # Traitement inverse pour conservation des positions
-                test_text = match.group(0)
-                test_text = re.sub(r'^•\s*', '', test_text).strip()  # Suppression puce initiale
-                test_text = self._clean_test_text(test_text)  # Pipeline de nettoyage artefacts
-
-                if test_text and len(test_text) > 10:  # Filtre qualité longueur minimum
-                    # Système de déduplication pour éviter les tests redondants
-                    if test_text not in current_req['tests']:
-                        current_req['tests'].append(test_text)
+        # Détection exhaustive en une seule passe de l'alternation précompilée
+        matches = list(_RE_EMBEDDED_TEST.finditer(remaining_text))
+
+        for match in reversed(matches):  # Traitement inverse pour conservation des positions
+            test_text = match.group(0)
+            test_text = _RE_BULLET.sub('', test_text).strip()  # Suppression puce initiale
+            test_text = self._clean_test_text(test_text)  # Pipeline de nettoyage artefacts
+
+            if test_text and len(test_text) > 10:  # Filtre qualité longueur minimum
+                # Système de déduplication pour éviter les tests redondants (set miroir O(1))
+                if test_text not in current_req['_test_set']:
+                    current_req['tests'].append(test_text)
+                    current_req['_test_set'].add(test_text)
+
+                # Extraction chirurgicale du segment test du texte principal
+                remaining_text = remaining_text[:match.start()] + ' ' + remaining_text[match.end():]
 
-                    # Extraction chirurgicale du segment test du texte principal
-                    remaining_text = remaining_text[:match.start()] + ' ' + remaining_text[match.end():]
-        
         # Normalisation finale avec compression des espaces
-        remaining_text = re.sub(r'\s+', ' ', remaining_text).strip()
+        remaining_text = _RE_WS.sub(' ', remaining_text).strip()
         return remaining_text  # Retour du texte nettoyé sans les tests extraits
 
     def _clean_test_text(self, text: str) -> str:
@@ -474,19 +599,12 @@ class PCIRequirementsExtractor:
         Pipeline de nettoyage spcialisé pour supprimer les éléments parasites
         liés à la conversion PDF et aux tableaux de réponse
         """
-        # Suppression des artefacts de mise en page PDF
-        text = re.sub(r'SAQ D de PCI DSS.*?Page \d+.*', '', text, flags=re.IGNORECASE)  # Headers/footers
-        text = re.sub(r'© 2006-.*?LLC.*', '', text, flags=re.IGNORECASE)  # Copyright notices
-        text = re.sub(r'En Place.*?Pas en Place', '', text, flags=re.IGNORECASE)  # Status indicators
-        text = re.sub(r'♦\s*Se reporter.*', '', text, flags=re.IGNORECASE)  # Cross-references
-        
-        # Élimination des artefacts de tableaux de réponse de conformité
-        text = re.sub(r'avec CCW Non Applicable Non Testé Pas.*', '', text, flags=re.IGNORECASE)  # Fragments de tableau
-        text = re.sub(r'En Place\s+En Place avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place', '', text, flags=re.IGNORECASE)  # Headers complets
-        text = re.sub(r'(En Place|Pas en Place|Non Applicable|Non Testé|CCW)(\s+(En Place|Pas en Place|Non Applicable|Non Testé|CCW))*', '', text, flags=re.IGNORECASE)  # Séquences de status
+        # Passe unique de l'alternation fusionnée sur tous les artefacts
+        # (headers/footers, copyrights, tableaux de réponse, cross-références)
+        text = _RE_ARTIFACTS.sub('', text)
 
         # Normalisation finale des espaces et retour
-        text = re.sub(r'\s+', ' ', text)  # Compression des espaces multiples
+        text = _RE_WS.sub(' ', text)  # Compression des espaces multiples
         return text.strip()  # Suppression espaces de début/fin
 
     def _clean_guidance_text(self, text: str) -> str:
@@ -494,12 +612,10 @@ class PCIRequirementsExtractor:
 
         Nettoyage spécialisé pour les sections de conseils et notes d'applicabilité
         """
-        # Application du même pipeline de nettoyage que les tests
-        text = re.sub(r'SAQ D de PCI DSS.*?Page \d+.*', '', text, flags=re.IGNORECASE)  # Headers PDF
-        text = re.sub(r'© 2006-.*?LLC.*', '', text, flags=re.IGNORECASE)  # Copyrights
-        text = re.sub(r'En Place.*?Pas en Place', '', text, flags=re.IGNORECASE)  # Status artifacts
+        # Application du même pipeline fusionné que les tests
+        text = _RE_ARTIFACTS.sub('', text)
         # Normalisation et retour du texte guidance nettoyé
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WS.sub(' ', text)
         return text.strip()
 
     def _is_valid_text_line(self, line: str, current_text: str) -> bool:
@@ -526,61 +642,29 @@ class PCIRequirementsExtractor:
 
         Filtre exhaustif des contenus non pertinents (headers, footers, artefacts)
         """
-        # Définition des patterns regex pour filtrage automatique
-        ignore_patterns = [
-            r'^SAQ D de PCI DSS',          # Headers de document
-            r'^© 2006-\d+',               # Copyrights avec années
-            r'^Page \d+',                  # Numéros de page
-            r'^Octobre 2024',              # Dates de publication
-            r'^Exigence de PCI DSS',       # Labels sections
-            r'^Tests Prévus',             # Headers de test
-            r'^Réponse',                   # Headers de réponse
-            r'^En Place',                  # Statuts de conformité
-            r'^Pas en Place',
-            r'^Non Applicable',
-            r'^Non Testé',
-            r'^♦ Se reporter',           # Cross-références
-            r'^\(Cocher une réponse',      # Instructions UI
-            r'^Section \d+',               # Numérotation sections
-            r'^Tous Droits Réservés',     # Mentions légales
-            r'^LLC\.',                     # Suffixes entreprise
-            r'^PCI Security Standards Council',  # Nom organisation
-        ]
-        
-        line_lower = line.lower()  # Conversion en minuscules pour optimisation
-        # Balayage de tous les patterns d'exclusion
-        for pattern in ignore_patterns:
-            if re.match(pattern, line, re.IGNORECASE):  # Match insensible à la casse
-                return True
-
         # Filtre de longueur : éliminer les lignes parasites trop courtes
         if len(line.strip()) <= 2:
             return True
 
-        return False  # Par défaut, ne pas ignorer la ligne
+        # Pré-filtre littéral : si la ligne ne commence par aucun caractère
+        # initial des patterns d'exclusion, inutile d'invoquer le regex
+        if not line.startswith(_IGNORE_PREFIX):
+            return False
+
+        # Alternation ancrée unique (insensible à la casse)
+        return _IGNORE_ALT.match(line) is not None
 
     def _remove_response_artifacts(self, text: str) -> str:
         """Supprime les artefacts de cases de réponse du questionnaire
 
         Pipeline avanci de suppression des éléments UI et interactifs du formulaire
         """
-        # Définition des patterns d'élimination des éléments interactifs
-        patterns_to_remove = [
-            r'avec CCW Non Applicable Non Testé Pas.*?(?=\n|$)',  # Fragments de tableau de statut
-            r'En Place\s+En Place avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place',  # Header complet tableau
-            r'avec CCW\s+Non Applicable\s+Non Testé\s+Pas en Place',  # Header partiel tableau
-            r'En Place.*?Pas en Place.*?(?=\n|$)',  # Range de statuts
-            r'(En Place|Pas en Place|Non Applicable|Non Testé|CCW)(\s+(En Place|Pas en Place|Non Applicable|Non Testé|CCW))+',  # Séquences multiples
-            r'♦\s*Se reporter.*?(?=\n|$)',  # Cross-références avec symboles
-            r'\(Cocher une réponse.*?\)',  # Instructions utilisateur
-        ]
-        
-        # Application itérative de tous les patterns de suppression
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)  # Suppression insensible casse
+        # Application itérative des patterns de suppression précompilés
+        for pattern in _RESPONSE_ARTIFACT_RES:
+            text = pattern.sub('', text)  # Suppression insensible casse
 
         # Normalisation finale des espaces et retour du texte nettoyé
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WS.sub(' ', text)
         return text.strip()
 
     def _finalize_requirement(self, req: Dict[str, Any]):
@@ -597,30 +681,69 @@ class PCIRequirementsExtractor:
 
         # Normalisation finale du texte principal
         req['text'] = req['text'].strip()
-        req['text'] = re.sub(r'\s+', ' ', req['text'])  # Compression espaces
+        req['text'] = _RE_WS.sub(' ', req['text'])  # Compression espaces
         
         # Pipeline de nettoyage et déduplication des procédures de test
         cleaned_tests = []
+        cleaned_seen = set()  # Dédup O(1) des tests nettoyés
         for test in req['tests']:
             test_clean = self._remove_response_artifacts(test)  # Suppression artefacts
             test_clean = test_clean.strip()
-            test_clean = re.sub(r'\s+', ' ', test_clean)  # Normalisation espaces
+            test_clean = _RE_WS.sub(' ', test_clean)  # Normalisation espaces
             # Filtrage qualité : longueur minimum + déduplication
-            if test_clean and test_clean not in cleaned_tests and len(test_clean) > 10:
+            if test_clean and test_clean not in cleaned_seen and len(test_clean) > 10:
                 cleaned_tests.append(test_clean)
+                cleaned_seen.add(test_clean)
         req['tests'] = cleaned_tests
-        
+
+        # Le set miroir est un détail interne : retiré du schéma de sortie
+        req.pop('_test_set', None)
+
         # Nettoyage final de la section guidance/conseils
         req['guidance'] = self._remove_response_artifacts(req['guidance'])  # Suppression artefacts
         req['guidance'] = req['guidance'].strip()
-        req['guidance'] = re.sub(r'\s+', ' ', req['guidance'])  # Normalisation espaces
+        req['guidance'] = _RE_WS.sub(' ', req['guidance'])  # Normalisation espaces
+
+    def _cache_path(self) -> str:
+        """Chemin du cache disque keyé sur (chemin, mtime, version du parser)
+
+        Retraiter le même SAQ inchangé redonne exactement le même résultat :
+        la mémorisation sur disque ramène les re-runs de plusieurs secondes à
+        quelques millisecondes.
+        """
+        import os
+        import hashlib
+        key = hashlib.sha1(
+            f"{os.path.abspath(self.pdf_path)}:{os.path.getmtime(self.pdf_path)}:{_CACHE_VERSION}".encode()
+        ).hexdigest()
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'pci_extractor')
+        return os.path.join(cache_dir, f"{key}.json")
 
     def extract_all_requirements(self) -> List[Dict[str, Any]]:
         """Extrait toutes les exigences du PDF
 
         Méthode principale orchestrant tout le pipeline d'extraction
         """
-        print("Lecture du PDF...")  # Phase 1: Extraction PDF
+        # Phase 0: Cache disque — un PDF déjà traité (même chemin, même mtime,
+        # même version du parser) est rechargé directement
+        cache_path = None
+        try:
+            cache_path = self._cache_path()
+            import os
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    self.requirements = json.load(f)
+                print(f"Exigences rechargées depuis le cache: {cache_path}")
+                return self.requirements
+        except Exception as e:
+            print(f"Cache disque indisponible, extraction complète: {e}")
+
+        print("Lecture du PDF...")  # Phase 1: Extraction PDF (parsé une seule fois)
+        try:
+            self._load_pages()
+        except Exception as e:
+            print(f"Erreur lors de la lecture du PDF: {e}")
+            return []
         raw_text = self.read_pdf_content()
         if not raw_text:
             print("Échec de la lecture du PDF.")
@@ -631,6 +754,17 @@ class PCIRequirementsExtractor:
 
         print("Parsing des exigences...")  # Phase 3: Parsing structuré
         self.requirements = self.parse_requirements(clean_text)
+
+        # Phase 4: Écriture du cache disque pour les prochains runs
+        if cache_path and self.requirements:
+            try:
+                import os
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.requirements, f, ensure_ascii=False)
+            except Exception as e:
+                print(f"Impossible d'écrire le cache disque: {e}")
+
         return self.requirements  # Retour des exigences extraites
 
     def print_summary(self):